@@ -2,27 +2,56 @@
 from __future__ import annotations
 
 import argparse
-import csv
+import functools
 import hashlib
+import io
+import itertools
 import json
+import mmap
+import os
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator
+
+try:  # optional: faster .meta.json reads/writes
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_FRONT_MATTER_PAGES = 2
+_WATCH_DEBOUNCE_SECONDS = 1.0
+_MMAP_HASH_MIN_BYTES = 1024 * 1024
+
+
+def _extract_text_with_pdftotext(pdf_path: Path, last_page: int | None = None) -> str:
+    cmd = ["pdftotext", "-enc", "UTF-8", "-nopgbrk"]
+    if last_page is not None:
+        cmd += ["-f", "1", "-l", str(last_page)]
+    cmd += [str(pdf_path), "-"]
+    # Decode stdout incrementally instead of buffering the whole byte string and
+    # decoding it afterwards. stderr goes to a temp file so a chatty pdftotext
+    # cannot block on a full pipe while we are still reading stdout.
+    with tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=err)
+        with io.TextIOWrapper(proc.stdout, encoding="utf-8", errors="replace", newline="") as out:
+            text = out.read()
+        returncode = proc.wait()
+        if returncode != 0:
+            err.seek(0)
+            stderr = err.read().decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"pdftotext failed for {pdf_path.name}: {stderr}")
+    return text
 
 
-def _extract_text_with_pdftotext(pdf_path: Path) -> str:
-    cmd = ["pdftotext", "-enc", "UTF-8", "-nopgbrk", str(pdf_path), "-"]
-    result = subprocess.run(cmd, capture_output=True)
-    if result.returncode != 0:
-        stderr = result.stderr.decode("utf-8", errors="replace").strip()
-        raise RuntimeError(f"pdftotext failed for {pdf_path.name}: {stderr}")
-    return result.stdout.decode("utf-8", errors="replace")
-
-
-def _extract_text_with_pymupdf(pdf_path: Path) -> str:
+def _extract_text_with_pymupdf(pdf_path: Path, last_page: int | None = None) -> str:
     try:
         import fitz  # type: ignore
     except Exception as exc:  # pragma: no cover
@@ -34,7 +63,8 @@ def _extract_text_with_pymupdf(pdf_path: Path) -> str:
 
     doc = fitz.open(str(pdf_path))
     try:
-        return "\n".join(page.get_text("text") for page in doc)
+        page_count = len(doc) if last_page is None else min(last_page, len(doc))
+        return "\n".join(doc[i].get_text("text") for i in range(page_count))
     finally:
         doc.close()
 
@@ -45,13 +75,28 @@ def extract_text(pdf_path: Path) -> tuple[str, str]:
     return _extract_text_with_pymupdf(pdf_path), "pymupdf"
 
 
+def extract_front_matter_text(pdf_path: Path, max_pages: int = _FRONT_MATTER_PAGES) -> tuple[str, str]:
+    """Extract only the first pages, where title/authors/affiliations/DOI live."""
+    if shutil.which("pdftotext"):
+        return _extract_text_with_pdftotext(pdf_path, last_page=max_pages), "pdftotext"
+    return _extract_text_with_pymupdf(pdf_path, last_page=max_pages), "pymupdf"
+
+
 def _sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as f:
-        while True:
-            chunk = f.read(1024 * 1024)
-            if not chunk:
-                break
+        if os.fstat(f.fileno()).st_size >= _MMAP_HASH_MIN_BYTES:
+            # Large PDFs: hash the page cache directly, with no read buffers.
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return hashlib.sha256(mm).hexdigest()
+            except (OSError, ValueError):
+                f.seek(0)
+        # Python 3.11+: hash in C with the GIL released, reading straight into
+        # a reusable buffer instead of allocating a bytes object per chunk.
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(functools.partial(f.read, 1024 * 1024), b""):
             digest.update(chunk)
     return digest.hexdigest()
 
@@ -65,14 +110,31 @@ def iter_pdfs(input_path: Path) -> list[Path]:
     if not input_path.is_dir():
         raise FileNotFoundError(f"--input not found: {input_path}")
 
-    pdfs: list[Path] = []
-    for path in input_path.rglob("*"):
-        if not path.is_file():
-            continue
-        if path.suffix.lower() != ".pdf":
+    return sorted(_walk_pdfs(input_path))
+
+
+def _walk_pdfs(root: Path) -> Iterator[Path]:
+    # os.scandir reports file/dir type from the directory listing itself, so
+    # unlike rglob("*") + is_file() only PDF candidates cost a stat. Symlinked
+    # directories are not descended into, matching rglob.
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
             continue
-        pdfs.append(path)
-    return sorted(pdfs)
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.name.lower().endswith(".pdf") and entry.is_file():
+                    path = Path(entry.path)
+                    if path.suffix.lower() == ".pdf":
+                        yield path
+            except OSError:
+                continue
 
 
 def _output_paths_for_pdf(pdf_path: Path, input_root: Path, txt_out: Path) -> tuple[Path, Path]:
@@ -88,26 +150,32 @@ def _output_paths_for_pdf(pdf_path: Path, input_root: Path, txt_out: Path) -> tu
 def _sync_txt_outputs(txt_out: Path, keep_files: set[Path]) -> None:
     if not txt_out.exists():
         return
-    keep_files = {p.resolve() for p in keep_files}
-    for path in txt_out.rglob("*"):
-        if not path.is_file():
-            continue
-        name = path.name
-        if not (name.endswith(".txt") or name.endswith(".meta.json")):
-            continue
-        if path.resolve() in keep_files:
-            continue
-        try:
-            path.unlink()
-        except OSError:
-            pass
-
-    for directory in sorted([p for p in txt_out.rglob("*") if p.is_dir()], reverse=True):
-        try:
-            if not any(directory.iterdir()):
-                directory.rmdir()
-        except OSError:
+    # Compare normalized absolute path strings rather than resolve()-ing every
+    # file, and prune empty directories bottom-up in the same walk.
+    keep = {os.path.normpath(os.path.abspath(p)) for p in keep_files}
+    root_dir = os.path.abspath(txt_out)
+    removed_dirs: set[str] = set()
+    for directory, dirnames, filenames in os.walk(root_dir, topdown=False):
+        remaining = len(filenames)
+        for name in filenames:
+            if not (name.endswith(".txt") or name.endswith(".meta.json")):
+                continue
+            path = os.path.join(directory, name)
+            if path in keep:
+                continue
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            remaining -= 1
+        if directory == root_dir or remaining:
             continue
+        if all(os.path.join(directory, d) in removed_dirs for d in dirnames):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                continue
+            removed_dirs.add(directory)
 
 
 _DOI_RE = re.compile(r"\b10\.\d{4,9}/[-._;()/:A-Z0-9]+\b", re.IGNORECASE)
@@ -124,18 +192,94 @@ _VOL_NO_PAGES_RE = re.compile(
     re.IGNORECASE,
 )
 _ARTICLE_TYPE_HINT_RE = re.compile(r"\b(case report|short case report)\b", re.IGNORECASE)
-_FRONT_MATTER_STOP_RE = re.compile(r"^(abstract|introduction|background)\b", re.IGNORECASE)
 _EMAIL_RE = re.compile(r"\b[\w.+-]+@[\w.-]+\.\w+\b")
 _URL_RE = re.compile(r"^https?://\S+$", re.IGNORECASE)
-_DOI_URL_RE = re.compile(r"^https?://doi\.org/\S+$", re.IGNORECASE)
-_PAGE_NUMBER_RE = re.compile(r"^\d{1,4}$")
+_FRONT_MATTER_CHARS = 20000
+_FULLWIDTH_DIGIT_CHARS = "０１２３４５６７８９"
+_FULLWIDTH_DIGITS = str.maketrans(_FULLWIDTH_DIGIT_CHARS, "0123456789")
 _CAPTION_START_RE = re.compile(r"^(?:figure|table)\s*\d+\s*[.:]\s+\S+", re.IGNORECASE)
 _CASE_START_RE = re.compile(r"\b(?:A|An)\s+\d{1,3}\s*[-–]?\s*year[- ]old\b", re.IGNORECASE)
 _FIGURE_CAPTION_START_RE = re.compile(r"^(?:figure|fig\.?)\s*\d+\s*[.:]\s+\S+", re.IGNORECASE)
-_FIGURE_PANEL_LABEL_RE = re.compile(r"^\d{0,2}[A-Z]{1,2}\d{0,2}$")
+_MOJIBAKE_TIMES_BETWEEN_DIGITS_RE = re.compile(r"(?<=\d)\s*©\s*(?=\d)")
+_MOJIBAKE_TIMES_NUMBER_RE = re.compile(r"(?P<prefix>[\s(,])©\s*(?P<number>\d{1,4})")
+_MOJIBAKE_LEADING_TIMES_RE = re.compile(r"^©\s*(?P<number>\d{1,4})")
+_LAB_EXPONENT_PER_UL_RE = re.compile(r"×\s*10\s*(?P<exp>\d)\s*/\s*(?P<unit>[µμ]L)\b")
+_LAB_EXPONENT_PER_L_RE = re.compile(r"×\s*10\s*(?P<exp>\d)\s*/\s*(?P<unit>L)\b")
+_DASHED_PAGE_NUMBER_RE = re.compile(r"[—–-]\s*\d{1,4}\s*[—–-]")
+_DOI_LINE_RE = re.compile(r"(?i)^doi:\s*10\.\d{4,9}/\S+$")
+_HEADING_PREFIX_RE = re.compile(
+    r"(?i)^(abstract|introduction|background|keywords|key words|case presentation|case report|discussion|references|conclusion|acknowledgements|acknowledgments)\b"
+)
+_DEGREE_RE = re.compile(r"(?i)\b(md|phd|m\.d\.|msc|m\.sc\.|ms)\b")
+_NAME_RUN_RE = re.compile(r"\b[A-Z][A-Za-z'’\-]+(?:\s+[A-Z][A-Za-z'’\-]+){1,3}\b")
+_NAME_LINE_RE = re.compile(r"[A-Z][A-Za-z'’\-]+(?:\s+[A-Z][A-Za-z'’\-]+){1,3}")
+_DIGITS_RE = re.compile(r"\d+")
+_INLINE_URL_RE = re.compile(r"https?://\S+")
+_JOURNAL_COPYRIGHT_PREFIX_RE = re.compile(r"^(?:©|\(c\)|copyright)\s*\d{4}\s*", re.IGNORECASE)
+_PREPOSITION_TAIL_RE = re.compile(r"(?i)\b(in|of|to|for|with|without|by|as|at|from|during|on)\s*$")
+_ARTICLE_START_RE = re.compile(r"(?i)^(the|a|an)\b")
+_YEAR_VOL_LINE_RE = re.compile(r"^20\d{2}\s*,?\s*vol\.?\s*\d+\b")
+_YEAR_RE = re.compile(r"\b20\d{2}\b")
+_TRAILING_DASHED_NUMBER_RE = re.compile(r"(?:[—–-]\s*\d{1,4}\s*[—–-])\s*$")
+_DOI_PREFIX_RE = re.compile(r"(?i)^doi:\s*10\.")
+_AUTHOR_AND_SPLIT_RE = re.compile(r"\s+(?:and|&)\s+", re.IGNORECASE)
+_DEPT_OF_RE = re.compile(r"(?i)\b(?:Department|Division|Section|Unit)\s+of\s+([^,]+)")
+_X_DEPT_RE = re.compile(r"(?i)\b([^,]+?)\s+Department\b")
+_BRACKET_CITATION_RE = re.compile(r"\[\d+\]")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+# Diagnosis cues, one scan per source. "diagnosed" is only looked ahead at
+# so the same words can still match as "diagnosed with/as".
+_TENTATIVE_DX_RE = re.compile(
+    r"(?i)\b(?:(?:was|were)\s+(?:(?P<considered>(?:also\s+)?considered)|(?P<suspected>suspected))"
+    r"|(?P<suspicion>suspicion\s+of))\b"
+)
+_FINAL_DX_RE = re.compile(
+    r"(?i)\b(?:(?P<diagnosed>(?:was|were)\s+(?:promptly\s+|clinically\s+|presumptively\s+|ultimately\s+|definitively\s+|finally\s+)?(?=diagnosed\b))"
+    r"|(?P<diagnosed_with>diagnosed\s+(?:with|as)\b)"
+    r"|(?P<confirmed>confirm(?:ed)?\s+(?:the\s+presence\s+of|presence\s+of|the\s+diagnosis\s+of|diagnosis\s+of)\s+)"
+    r"|(?P<revealed>(?:revealed|identified)\s+(?:a|an)\s+))"
+)
+_FRONT_MATTER_SCAN_RE = re.compile(
+    r"(?P<stop>^(?:abstract|introduction|background)\b)|\b(?P<label>Journal|Title|Type|Authors|Affiliations)\s*:\s*",
+    re.IGNORECASE,
+)
+_FRONT_MATTER_STOP_RE = re.compile(r"(?:abstract|introduction|background)\b", re.IGNORECASE)
+_LABEL_FIELDS = {"journal": "journal_raw", "title": "title", "authors": "authors", "affiliations": "affiliations"}
+_AUTHORS_LABEL_RE = re.compile(r"^\s*authors?\s*:\s*(?P<authors>.+?)\s*$", re.IGNORECASE)
+_NUM_PAREN_RE = re.compile(r"\b\d+\)\s+")
+_NUM_PAREN_SPLIT_RE = re.compile(r"(?=\b\d+\)\s+)")
+_AUTHOR_NUMBERS_RE = re.compile(r"(?:\b\d+\)\s*)+|\d+")
+_AFF_NUM_LINE_RE = re.compile(r"^\s*\d+\)\s+")
+_AFF_NUM_KEYWORD_RE = re.compile(
+    r"^\s*\d+\s*(?:\)|[).]|,)?\s*(?:department|division|faculty|school|university|hospital|medical center|medical centre|centre|center|clinic|clinical|institute|laboratory|unit|program)\b"
+)
+_AFF_ENTRY_RE = re.compile(r"^(?P<num>\d+)\)\s+(?P<rest>.+)$")
+_AFF_NUM_PREFIX_RE = re.compile(r"^(?P<num>\d+)\s*(?:\)|[).]|,)?\s*(?P<rest>.+)$")
+
+# Keyword alternations matched against lowercased lines: one regex scan per
+# line instead of one substring scan per keyword.
+_LINK_RE = re.compile(r"http|doi")
+_LINK_OR_CC_RE = re.compile(r"http|doi|creativecommons")
+_LINK_OR_LICENSE_RE = re.compile(r"http|doi|creativecommons|license")
+_TITLE_REJECT_RE = re.compile(
+    r"http|doi|creativecommons|license|received|accepted|conflict|keywords|abstract|references"
+)
+_AUTHORS_STOP_RE = re.compile(r"received|accepted|conflict|copyright|creativecommons")
+_AUTHORS_REJECT_RE = re.compile(r"department|hospital|university|abstract|keywords|received|accepted")
+_INSTITUTION_RE = re.compile(r"department|hospital|university|institute|centre|center|clinic")
+_AFF_BLOCK_KEYWORDS_RE = re.compile(
+    r"department|division|faculty|school|university|hospital|centre|center|clinic|institute|laboratory|program|japan"
+)
+# "medical center"/"medical centre" are covered by "center"/"centre".
+_DEPARTMENT_PARTNER_RE = re.compile(r"hospital|university|centre|center|clinic|institute")
+_OTHER_LABEL_RE = re.compile(r"title:|authors?:|affiliations?:")
+_AFF_KEYWORDS_RE = re.compile(
+    r"department|division|faculty|school|university|hospital|institute|centre|center|clinic|laboratory|research"
+)
 
 _HYPHEN_CHARS = "-\u2010\u2011\u00ad"
-_HYPHEN_LINEBREAK_RE = re.compile(rf"(?P<left>[A-Za-z0-9]{{1,}})[{_HYPHEN_CHARS}]\n\s*(?P<right>[A-Za-z0-9]{{1,}})")
+_HYPHEN_LINEBREAK_PROBES = tuple(f"{hyphen}\n" for hyphen in _HYPHEN_CHARS)
 _KEEP_HYPHEN_LEFT = {
     "life",
     "long",
@@ -144,55 +288,11 @@ _KEEP_HYPHEN_LEFT = {
     "low",
     "well",
 }
-_COMMON_SUFFIXES = {
-    "a",
-    "able",
-    "al",
-    "ally",
-    "ation",
-    "ations",
-    "ed",
-    "er",
-    "ers",
-    "es",
-    "est",
-    "ful",
-    "ically",
-    "ic",
-    "ics",
-    "ing",
-    "ion",
-    "ions",
-    "ism",
-    "ist",
-    "ists",
-    "ity",
-    "ities",
-    "ive",
-    "ize",
-    "ized",
-    "izes",
-    "izing",
-    "less",
-    "ly",
-    "ment",
-    "ments",
-    "ness",
-    "ous",
-    "s",
-    "tion",
-    "tions",
-    # medical-ish suffixes
-    "emia",
-    "itis",
-    "logy",
-    "mography",
-    "opathy",
-    "osis",
-    "scopy",
-    "titis",
-    "uria",
-}
+# Anchored at a word boundary so a failed match is not retried from every
+# character inside the same word.
+_HYPHEN_LINEBREAK_RE = re.compile(
+    rf"(?<![A-Za-z0-9])(?P<left>[A-Za-z0-9]+)[{_HYPHEN_CHARS}]\n\s*(?P<right>[A-Za-z0-9]+)"
+)
 
 _KNOWN_HEADINGS = {
     "abstract",
@@ -216,74 +316,113 @@ _KNOWN_HEADINGS = {
 }
 
 
+# The same raw text is normalized by the figure, cleanup and metadata passes,
+# and the cleaned text again by the section and first-author passes; a tiny
+# cache makes the repeats free without holding on to more than a few PDFs.
+@functools.lru_cache(maxsize=4)
 def _normalize_text(text: str) -> str:
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
     if text.startswith("\ufeff"):
         text = text.lstrip("\ufeff")
     # Normalize fullwidth digits so regexes can match across PDF extractors.
-    text = text.translate(str.maketrans("０１２３４５６７８９", "0123456789"))
+    # str.translate walks the text per character in Python-level mapping
+    # lookups; checking for the ten digits first is ~300x cheaper when absent.
+    if any(digit in text for digit in _FULLWIDTH_DIGIT_CHARS):
+        text = text.translate(_FULLWIDTH_DIGITS)
     return text
 
 
-def _fix_common_mojibake(text: str) -> str:
-    # Some PDFs (font maps) mis-extract the multiplication sign "×" as "©".
-    # Fix only in numeric contexts to avoid touching copyright marks.
-    text = re.sub(r"(?<=\d)\s*©\s*(?=\d)", " × ", text)
+def _replace_multiply_symbol(match: re.Match[str]) -> str:
+    number = match.group("number")
+    if len(number) == 4 and number.startswith(("19", "20")):
+        return match.group(0)
+    return f"{match.group('prefix')}×{number}"
 
-    def replace_multiply_symbol(match: re.Match[str]) -> str:
-        prefix = match.group("prefix")
-        number = match.group("number")
-        if len(number) == 4 and number.startswith(("19", "20")):
-            return match.group(0)
-        return f"{prefix}×{number}"
 
-    text = re.sub(r"(?P<prefix>[\s(,])©\s*(?P<number>\d{1,4})", replace_multiply_symbol, text)
-    def replace_leading_multiply_symbol(match: re.Match[str]) -> str:
-        number = match.group("number")
-        if len(number) == 4 and number.startswith(("19", "20")):
-            return match.group(0)
-        return f"×{number}"
+def _replace_leading_multiply_symbol(match: re.Match[str]) -> str:
+    number = match.group("number")
+    if len(number) == 4 and number.startswith(("19", "20")):
+        return match.group(0)
+    return f"×{number}"
 
-    text = re.sub(r"^©\s*(?P<number>\d{1,4})", replace_leading_multiply_symbol, text)
+
+def _fix_common_mojibake(text: str) -> str:
+    # Some PDFs (font maps) mis-extract the multiplication sign "×" as "©".
+    # Fix only in numeric contexts to avoid touching copyright marks.
+    if "©" in text:
+        text = _MOJIBAKE_TIMES_BETWEEN_DIGITS_RE.sub(" × ", text)
+        text = _MOJIBAKE_TIMES_NUMBER_RE.sub(_replace_multiply_symbol, text)
+        text = _MOJIBAKE_LEADING_TIMES_RE.sub(_replace_leading_multiply_symbol, text)
 
     # Common lab notation: "×10^3/µL" sometimes becomes "× 103/µL" (caret lost).
-    text = re.sub(
-        r"×\s*10\s*(?P<exp>\d)\s*/\s*(?P<unit>[µμ]L)\b",
-        r"× 10^\g<exp>/\g<unit>",
-        text,
-    )
-    text = re.sub(
-        r"×\s*10\s*(?P<exp>\d)\s*/\s*(?P<unit>L)\b",
-        r"× 10^\g<exp>/\g<unit>",
-        text,
-    )
+    if "×" in text:
+        text = _LAB_EXPONENT_PER_UL_RE.sub(r"× 10^\g<exp>/\g<unit>", text)
+        text = _LAB_EXPONENT_PER_L_RE.sub(r"× 10^\g<exp>/\g<unit>", text)
     return text
 
 
 def _extract_doi(text: str) -> str:
-    match = _DOI_RE.search(text)
+    if "10." not in text:
+        return ""
+    # The DOI is nearly always in the front matter, so try the head first and
+    # re-match at the same offset on the full text in case it is cut short.
+    match = _DOI_RE.search(text, 0, _FRONT_MATTER_CHARS)
+    if match:
+        match = _DOI_RE.match(text, match.start())
+    elif len(text) > _FRONT_MATTER_CHARS:
+        match = _DOI_RE.search(text)
     return match.group(0) if match else ""
 
+def _join_hyphen_linebreak(match: re.Match[str]) -> str:
+    left, right = match.group("left", "right")
+    # left is ASCII alphanumeric, so "not isalpha()" means it contains a digit.
+    if not left.isalpha() or left.lower() in _KEEP_HYPHEN_LEFT:
+        return f"{left}-{right}"
+    return left + right
+
+
 def _fix_hyphen_linebreaks(text: str) -> str:
-    def repl(match: re.Match[str]) -> str:
-        left = match.group("left")
-        right = match.group("right")
-        left_lower = left.lower()
-        right_lower = right.lower()
+    # Substring probes are ~10x cheaper than letting the regex scan a text
+    # that has no hyphen at a line end.
+    if not any(probe in text for probe in _HYPHEN_LINEBREAK_PROBES):
+        return text
+    return _HYPHEN_LINEBREAK_RE.sub(_join_hyphen_linebreak, text)
+
+
+# The two shortest-line classifiers run on every line; plain str checks avoid
+# a regex call for them. isdecimal() is the same character class as \d.
+def _is_page_number(line: str) -> bool:
+    return 0 < len(line) <= 4 and line.isdecimal()
 
-        if any(ch.isdigit() for ch in left):
-            return f"{left}-{right}"
-        if left_lower in _KEEP_HYPHEN_LEFT:
-            return f"{left}-{right}"
-        if right_lower in _COMMON_SUFFIXES:
-            return f"{left}{right}"
-        return f"{left}{right}"
 
-    return _HYPHEN_LINEBREAK_RE.sub(repl, text)
+def _is_url_line(line: str) -> bool:
+    # Nearly every line fails on the first character, before any regex call.
+    return line[:1] in "hH" and _URL_RE.match(line) is not None
 
 
+def _is_panel_label(line: str) -> bool:
+    """Figure panel labels like "A", "2B", "B12": 0-2 digits, 1-2 capitals, 0-2 digits."""
+    n = len(line)
+    i = 0
+    while i < n and i < 2 and line[i].isdecimal():
+        i += 1
+    j = i
+    while j < n and j - i < 2 and "A" <= line[j] <= "Z":
+        j += 1
+    if j == i:
+        return False
+    k = j
+    while k < n and k - j < 2 and line[k].isdecimal():
+        k += 1
+    return k == n
+
+
+# Line classifiers are pure and see the same lines repeatedly (cleanup and
+# figure extraction walk the same text; headings recur across documents).
+@functools.lru_cache(maxsize=4096)
 def _is_heading_line(line: str) -> bool:
-    normalized = re.sub(r"\s+", " ", line.strip()).strip(":：").lower()
+    normalized = " ".join(line.split()).strip(":：").lower()
     if not normalized:
         return False
     if normalized in _KNOWN_HEADINGS:
@@ -295,35 +434,41 @@ def _is_heading_line(line: str) -> bool:
     return False
 
 
+_LAYOUT_NOISE_PREFIXES = (
+    "corresponding author:",
+    "e-mail:",
+    "email:",
+    "received for",
+    "received:",
+    "accepted:",
+    "copyright",
+    "©",
+    "(c)",
+    "this is an open access journal distributed",
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def _is_layout_noise_line(line: str) -> bool:
     lowered = line.strip().lower()
     if not lowered:
         return False
-    if lowered.startswith("corresponding author:"):
+    if lowered.startswith(_LAYOUT_NOISE_PREFIXES):
         return True
-    if lowered.startswith(("e-mail:", "email:")):
-        return True
-    if lowered.startswith(("received for publication", "received for")):
-        return True
-    if lowered.startswith(("received:", "accepted:", "copyright")):
-        return True
-    if lowered.startswith(("©", "(c)")):
-        return True
-    if re.fullmatch(r"[—–-]\s*\d{1,4}\s*[—–-]", line.strip()):
-        return True
-    if lowered.startswith("this is an open access journal distributed"):
+    if _DASHED_PAGE_NUMBER_RE.fullmatch(line.strip()):
         return True
     if "creativecommons.org" in lowered or "creative commons" in lowered:
         return True
     return False
 
 
+@functools.lru_cache(maxsize=4096)
 def _looks_like_repeated_header_line(line: str) -> bool:
-    if _DOI_URL_RE.match(line) or _URL_RE.match(line):
+    if _is_url_line(line):
         return True
-    if _PAGE_NUMBER_RE.match(line):
+    if _is_page_number(line):
         return True
-    if re.match(r"(?i)^doi:\s*10\.\d{4,9}/\S+$", line.strip()):
+    if _DOI_LINE_RE.match(line.strip()):
         return True
     match = _CITATION_RE.fullmatch(line)
     if match and len(line) <= 120 and not line.rstrip().endswith("."):
@@ -334,31 +479,29 @@ def _looks_like_repeated_header_line(line: str) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=4096)
 def _canonical_heading(line: str) -> str:
-    line = re.sub(r"\s+", " ", line.strip())
+    line = " ".join(line.split())
     if not line:
         return ""
     lowered = line.strip(":：").lower()
     if lowered in _KNOWN_HEADINGS:
         return lowered
-    match = re.match(
-        r"(?i)^(abstract|introduction|background|keywords|key words|case presentation|case report|discussion|references|conclusion|acknowledgements|acknowledgments)\b",
-        line,
-    )
+    match = _HEADING_PREFIX_RE.match(line)
     if not match:
         return ""
     return match.group(1).lower()
 
 
 def _clean_journal_name(journal_raw: str) -> str:
-    journal = re.sub(r"\s+", " ", journal_raw).strip().strip(" .;,:-–—")
+    journal = " ".join(journal_raw.split()).strip(" .;,:-–—")
     if not journal:
         return ""
     lowered = journal.lower()
     last_journal = lowered.rfind("journal")
     if last_journal != -1:
         journal = journal[last_journal:].strip()
-    journal = re.sub(r"^(?:©|\(c\)|copyright)\s*\d{4}\s*", "", journal, flags=re.IGNORECASE).strip()
+    journal = _JOURNAL_COPYRIGHT_PREFIX_RE.sub("", journal).strip()
     return journal.strip(" .;,:-–—")
 
 
@@ -371,12 +514,10 @@ def _should_resume_after_caption(line: str, paragraph: list[str], previous_text:
     if lowered.startswith(("the patient", "he ", "she ", "they ", "we ")):
         return True
     tail = paragraph[-1].strip() if paragraph else previous_text.strip()
-    preposition_tail = bool(
-        tail and re.search(r"(?i)\b(in|of|to|for|with|without|by|as|at|from|during|on)\s*$", tail)
-    )
+    preposition_tail = bool(tail and _PREPOSITION_TAIL_RE.search(tail))
     if tail and not preposition_tail and _should_join_soft_break(tail, line):
         return True
-    if preposition_tail and re.match(r"(?i)^(the|a|an)\b", lowered):
+    if preposition_tail and _ARTICLE_START_RE.match(lowered):
         return True
     return False
 
@@ -390,16 +531,19 @@ def _should_join_soft_break(prev: str, nxt: str) -> bool:
         return False
     if prev.endswith((".", "!", "?", ":", ";")):
         return False
-    if re.match(r"^[a-z]", nxt):
+    if "a" <= nxt[0] <= "z":
         return True
-    if re.search(r"(?i)\b(in|of|to|for|with|without|by|as|at|from|during|on)\s*$", prev) and re.match(
-        r"(?i)^(the|a|an)\b", nxt
-    ):
+    if _PREPOSITION_TAIL_RE.search(prev) and _ARTICLE_START_RE.match(nxt):
         return True
     return False
 
 
 def _join_soft_paragraph_breaks(lines: list[str]) -> list[str]:
+    """Merge paragraphs split by a page break.
+
+    Expects no leading, trailing or consecutive blank lines; joining a blank
+    with the line after it cannot introduce any, so the output keeps that form.
+    """
     out: list[str] = []
     i = 0
     while i < len(lines):
@@ -413,21 +557,14 @@ def _join_soft_paragraph_breaks(lines: list[str]) -> list[str]:
                 continue
         out.append(line)
         i += 1
-
-    deduped: list[str] = []
-    blank_pending = False
-    for line in out:
-        if line == "":
-            blank_pending = True
-            continue
-        if blank_pending and deduped:
-            deduped.append("")
-        blank_pending = False
-        deduped.append(line)
-    return deduped
+    return out
 
 
-def clean_extracted_text(text: str) -> str:
+# clean_extracted_text and extract_figure_legends are both run on every
+# freshly extracted PDF and share this whole preprocessing pass; the cache lets
+# the second caller reuse the first one's result. Callers must not mutate it.
+@functools.lru_cache(maxsize=2)
+def _prepare_lines(text: str) -> tuple[list[str], frozenset[str]]:
     text = _normalize_text(text)
     text = text.replace("\u00a0", " ").replace("\u3000", " ")
     # Some extractors emit control characters for symbols (e.g., "≥").
@@ -435,13 +572,18 @@ def clean_extracted_text(text: str) -> str:
     text = _fix_common_mojibake(text)
     text = _fix_hyphen_linebreaks(text)
 
-    raw_lines = [line.rstrip() for line in text.split("\n")]
-    counts: dict[str, int] = {}
-    for raw in raw_lines:
-        normalized = re.sub(r"\s+", " ", raw.strip())
-        if not normalized:
-            continue
-        counts[normalized] = counts.get(normalized, 0) + 1
+    # Whitespace-normalize every line once; the repeated-header set and the
+    # callers' main loops share the same canonical form.
+    norm_lines = [" ".join(raw.split()) for raw in text.split("\n")]
+    counts = Counter(line for line in norm_lines if line)
+    repeated_headers = frozenset(
+        line for line, count in counts.items() if count >= 2 and _looks_like_repeated_header_line(line)
+    )
+    return norm_lines, repeated_headers
+
+
+def clean_extracted_text(text: str) -> str:
+    norm_lines, repeated_headers = _prepare_lines(text)
 
     out_lines: list[str] = []
     paragraph: list[str] = []
@@ -457,7 +599,7 @@ def clean_extracted_text(text: str) -> str:
     seen_deduped: set[str] = set()
 
     def _front_matter_ended_by_heading(line: str) -> bool:
-        normalized = re.sub(r"\s+", " ", line.strip()).strip(":：").lower()
+        normalized = " ".join(line.split()).strip(":：").lower()
         return normalized in {
             "abstract",
             "introduction",
@@ -472,11 +614,11 @@ def clean_extracted_text(text: str) -> str:
         nonlocal last_emitted
         if not paragraph:
             return
-        merged = " ".join(part.strip() for part in paragraph if part.strip())
-        merged = re.sub(r"\s+", " ", merged).strip()
-        if merged:
-            out_lines.append(merged)
-            last_emitted = merged
+        # Lines come from _prepare_lines already stripped and
+        # whitespace-collapsed, and blank lines never reach the paragraph.
+        merged = " ".join(paragraph)
+        out_lines.append(merged)
+        last_emitted = merged
         paragraph = []
 
     def add_blank_line() -> None:
@@ -519,19 +661,17 @@ def clean_extracted_text(text: str) -> str:
             return True
         if "journal" in lowered and len(line) <= 120:
             return True
-        if re.match(r"^20\d{2}\s*,?\s*vol\.?\s*\d+\b", lowered) or (
-            "vol" in lowered and "no" in lowered and re.search(r"\b20\d{2}\b", lowered)
+        if _YEAR_VOL_LINE_RE.match(lowered) or (
+            "vol" in lowered and "no" in lowered and _YEAR_RE.search(lowered)
         ):
             return True
         if lowered in {"case reports", "case report"}:
             return True
-        if re.search(r"(?:[—–-]\s*\d{1,4}\s*[—–-])\s*$", line.strip()):
+        if _TRAILING_DASHED_NUMBER_RE.search(line.strip()):
             return True
         return False
 
-    for raw_line in raw_lines:
-        line = raw_line.strip()
-        line = re.sub(r"\s+", " ", line).strip()
+    for line in norm_lines:
 
         if in_correspondence_block:
             if not line:
@@ -553,27 +693,7 @@ def clean_extracted_text(text: str) -> str:
                     affiliation_budget > 0
                     and len(line) <= 160
                     and not line.endswith(".")
-                    and any(
-                        k in lowered
-                        for k in [
-                            "department",
-                            "division",
-                            "faculty",
-                            "school",
-                            "university",
-                            "hospital",
-                            "medical center",
-                            "medical centre",
-                            "centre",
-                            "center",
-                            "clinic",
-                            "clinical",
-                            "institute",
-                            "laboratory",
-                            "program",
-                            "japan",
-                        ]
-                    )
+                    and _AFF_BLOCK_KEYWORDS_RE.search(lowered)
                 ):
                     affiliation_budget -= 1
                     if affiliation_budget <= 0:
@@ -601,10 +721,10 @@ def clean_extracted_text(text: str) -> str:
             add_blank_line()
             continue
 
-        if _PAGE_NUMBER_RE.match(line):
+        if _is_page_number(line):
             continue
 
-        if not in_front_matter and re.match(r"(?i)^doi:\s*10\.", line):
+        if not in_front_matter and _DOI_PREFIX_RE.match(line):
             continue
 
         if not in_front_matter and _looks_like_affiliation_line(line):
@@ -621,7 +741,7 @@ def clean_extracted_text(text: str) -> str:
         if _is_layout_noise_line(line):
             continue
 
-        if counts.get(line, 0) >= 2 and _looks_like_repeated_header_line(line):
+        if line in repeated_headers:
             if line in seen_deduped:
                 continue
             seen_deduped.add(line)
@@ -635,7 +755,8 @@ def clean_extracted_text(text: str) -> str:
             caption_budget = 30
             continue
 
-        if _URL_RE.match(line) or _DOI_URL_RE.match(line) or _PAGE_NUMBER_RE.match(line):
+        # Page numbers were already dropped above.
+        if _is_url_line(line):
             flush_paragraph()
             out_lines.append(line)
             last_emitted = line
@@ -655,43 +776,23 @@ def clean_extracted_text(text: str) -> str:
             if front_matter_budget <= 0:
                 in_front_matter = False
             flush_paragraph()
-            out_lines.append(re.sub(r"\s+", " ", line).strip())
+            out_lines.append(line)
             continue
 
         paragraph.append(line)
 
     flush_paragraph()
 
-    cleaned: list[str] = []
-    blank_pending = False
-    for line in out_lines:
-        if line == "":
-            blank_pending = True
-            continue
-        if blank_pending and cleaned:
-            cleaned.append("")
-        blank_pending = False
-        cleaned.append(line)
-
-    cleaned = _join_soft_paragraph_breaks(cleaned)
+    # add_blank_line() never emits a leading or doubled blank, so a trailing
+    # one is the only thing left to trim.
+    if out_lines and out_lines[-1] == "":
+        out_lines.pop()
 
-    return "\n".join(cleaned).strip() + "\n"
+    return "\n".join(_join_soft_paragraph_breaks(out_lines)).strip() + "\n"
 
 
 def extract_figure_legends(text: str) -> str:
-    text = _normalize_text(text)
-    text = text.replace("\u00a0", " ").replace("\u3000", " ")
-    text = text.replace("\x02", "≥")
-    text = _fix_common_mojibake(text)
-    text = _fix_hyphen_linebreaks(text)
-
-    raw_lines = [line.rstrip() for line in text.split("\n")]
-    counts: dict[str, int] = {}
-    for raw in raw_lines:
-        normalized = re.sub(r"\s+", " ", raw.strip())
-        if not normalized:
-            continue
-        counts[normalized] = counts.get(normalized, 0) + 1
+    norm_lines, repeated_headers = _prepare_lines(text)
 
     legends: list[str] = []
     current: list[str] = []
@@ -707,24 +808,17 @@ def extract_figure_legends(text: str) -> str:
         nonlocal last_emitted
         if not paragraph:
             return
-        merged = " ".join(part.strip() for part in paragraph if part.strip())
-        merged = re.sub(r"\s+", " ", merged).strip()
-        if merged:
-            last_emitted = merged
+        last_emitted = " ".join(paragraph)
         paragraph = []
 
     def flush_caption() -> None:
         nonlocal current
         if not current:
             return
-        merged = " ".join(part.strip() for part in current if part.strip())
-        merged = re.sub(r"\s+", " ", merged).strip()
-        if merged:
-            legends.append(merged)
+        legends.append(" ".join(current))
         current = []
 
-    for raw_line in raw_lines:
-        line = re.sub(r"\s+", " ", raw_line.strip()).strip()
+    for line in norm_lines:
 
         if in_caption_block:
             if not line:
@@ -736,7 +830,7 @@ def extract_figure_legends(text: str) -> str:
                 current = [line]
                 caption_budget = 40
                 continue
-            if len(line) <= 3 and _FIGURE_PANEL_LABEL_RE.fullmatch(line):
+            if len(line) <= 3 and _is_panel_label(line):
                 continue
             if _is_heading_line(line):
                 flush_caption()
@@ -752,9 +846,9 @@ def extract_figure_legends(text: str) -> str:
                     in_caption_block = False
                     continue
                 lowered = line.lower()
-                if _URL_RE.match(line) or _DOI_URL_RE.match(line) or _PAGE_NUMBER_RE.match(line):
+                if _is_url_line(line) or _is_page_number(line):
                     continue
-                if counts.get(line, 0) >= 2 and _looks_like_repeated_header_line(line):
+                if line in repeated_headers:
                     continue
                 if _is_layout_noise_line(line):
                     continue
@@ -773,14 +867,14 @@ def extract_figure_legends(text: str) -> str:
             current = [line]
             continue
 
-        if _URL_RE.match(line) or _DOI_URL_RE.match(line) or _PAGE_NUMBER_RE.match(line):
+        if _is_url_line(line) or _is_page_number(line):
             flush_paragraph()
             continue
 
         if _is_layout_noise_line(line):
             continue
 
-        if counts.get(line, 0) >= 2 and _looks_like_repeated_header_line(line):
+        if line in repeated_headers:
             if line in seen_deduped:
                 continue
             seen_deduped.add(line)
@@ -801,59 +895,95 @@ def extract_figure_legends(text: str) -> str:
     return "\n\n".join(legends).strip()
 
 
+@functools.lru_cache(maxsize=4096)
 def _looks_like_affiliation_line(line: str) -> bool:
-    if re.search(r"^\s*\d+\)\s+", line):
+    if _AFF_NUM_LINE_RE.match(line):
         return True
     lowered = line.lower()
-    if re.match(
-        r"^\s*\d+\s*(?:\)|[).]|,)?\s*(?:department|division|faculty|school|university|hospital|medical center|medical centre|centre|center|clinic|clinical|institute|laboratory|unit|program)\b",
-        lowered,
-    ):
+    if _AFF_NUM_KEYWORD_RE.match(lowered):
         return True
-    if "department" in lowered and any(
-        k in lowered
-        for k in [
-            "hospital",
-            "university",
-            "medical center",
-            "medical centre",
-            "centre",
-            "center",
-            "clinic",
-            "institute",
-        ]
-    ):
+    if "department" in lowered and _DEPARTMENT_PARTNER_RE.search(lowered):
         return True
     return False
 
 
+@functools.lru_cache(maxsize=4096)
 def _looks_like_author_line(line: str) -> bool:
     line = line.strip()
     if not line or _looks_like_affiliation_line(line):
         return False
     lowered = line.lower()
-    if re.search(r"(?i)\b(md|phd|m\.d\.|msc|m\.sc\.|ms)\b", line):
+    if _DEGREE_RE.search(line):
         return True
     if "," in line:
-        name_like = re.findall(r"\b[A-Z][A-Za-z'’\-]+(?:\s+[A-Z][A-Za-z'’\-]+){1,3}\b", line)
+        name_like = _NAME_RUN_RE.findall(line)
         if len(name_like) >= 2:
             return True
     if " and " in lowered:
         return True
-    if len(line) <= 60 and re.fullmatch(r"[A-Z][A-Za-z'’\-]+(?:\s+[A-Z][A-Za-z'’\-]+){1,3}", line):
+    if len(line) <= 60 and _NAME_LINE_RE.fullmatch(line):
         return True
     return False
 
 
 def _split_affiliations_from_line(line: str) -> list[str]:
     line = line.strip()
-    if not re.search(r"\b\d+\)\s+", line):
+    if not _NUM_PAREN_RE.search(line):
         return []
     lowered = line.lower()
-    if "affiliat" not in lowered and not re.match(r"^\d+\)\s+", line):
+    if "affiliat" not in lowered and not _NUM_PAREN_RE.match(line):
         return []
-    parts = re.split(r"(?=\b\d+\)\s+)", line)
-    return [p.strip() for p in parts if re.match(r"^\d+\)\s+", p.strip())]
+    parts = [p.strip() for p in _NUM_PAREN_SPLIT_RE.split(line)]
+    return [p for p in parts if _NUM_PAREN_RE.match(p)]
+
+
+_CITATION_PATTERNS = (_VOL_NO_PAGES_RE, _CITATION_VOL_PAGES_YEAR_RE, _CITATION_RE)
+
+
+def _iter_citation_candidates(singles: list[str], pair_source: list[str]) -> Iterator[str]:
+    # Every citation pattern needs a 20xx year; skip candidates without one
+    # before running the backtracking-heavy regexes. The joining space means
+    # a pair can only contain "20" if one of its lines does.
+    for line in singles:
+        if "20" in line:
+            yield line
+    for first, second in zip(pair_source, pair_source[1:]):
+        if "20" in first or "20" in second:
+            yield f"{first} {second}"
+
+
+def _first_citation_match(candidates: Iterable[str]) -> re.Match[str] | None:
+    """Return the earliest match of the highest-priority pattern that matches.
+
+    Equivalent to trying each pattern over all candidates in turn, but reads
+    the candidates once and stops testing a pattern as soon as a
+    higher-priority one has matched.
+    """
+    found: dict[int, re.Match[str]] = {}
+    for candidate in candidates:
+        for rank, pattern in enumerate(_CITATION_PATTERNS):
+            if found and rank >= min(found):
+                break
+            match = pattern.search(candidate)
+            if match:
+                if rank == 0:
+                    return match
+                found[rank] = match
+                break
+    return found[min(found)] if found else None
+
+
+def _citation_fields(match: re.Match[str]) -> dict[str, str]:
+    # All citation patterns share these group names; issue/pages are optional
+    # in some of them.
+    groups = match.groupdict(default="")
+    return {
+        "journal_name": _clean_journal_name(groups["journal"]),
+        "year": groups["year"].strip(),
+        "volume": groups["volume"].strip(),
+        "issue": groups["issue"].strip(),
+        "pages": "".join(groups["pages"].split()),
+    }
 
 
 def _find_citation(lines: list[str]) -> dict[str, str]:
@@ -864,149 +994,65 @@ def _find_citation(lines: list[str]) -> dict[str, str]:
             break
     search_lines = lines[:ref_idx] if ref_idx != -1 else lines
 
-    def iter_candidates(lines_in: list[str]) -> list[str]:
-        candidates: list[str] = []
-        candidates.extend(lines_in)
-        for i in range(len(lines_in) - 1):
-            candidates.append(f"{lines_in[i]} {lines_in[i + 1]}")
-        return candidates
-
     primary_lines = search_lines[:250]
-    candidates = iter_candidates(primary_lines)
-    for candidate in candidates:
-        match = _VOL_NO_PAGES_RE.search(candidate)
-        if not match:
-            continue
-        pages = match.group("pages") or ""
-        return {
-            "journal_name": _clean_journal_name(match.group("journal")),
-            "year": match.group("year").strip(),
-            "volume": match.group("volume").strip(),
-            "issue": match.group("issue").strip(),
-            "pages": re.sub(r"\s+", "", pages),
-        }
-
-    for candidate in candidates:
-        match = _CITATION_VOL_PAGES_YEAR_RE.search(candidate)
-        if not match:
-            continue
-        issue = (match.group("issue") or "").strip()
-        return {
-            "journal_name": _clean_journal_name(match.group("journal")),
-            "year": match.group("year").strip(),
-            "volume": match.group("volume").strip(),
-            "issue": issue,
-            "pages": re.sub(r"\s+", "", match.group("pages")),
-        }
-
-    for candidate in candidates:
-        match = _CITATION_RE.search(candidate)
-        if not match:
-            continue
-        return {
-            "journal_name": _clean_journal_name(match.group("journal")),
-            "year": match.group("year").strip(),
-            "volume": match.group("volume").strip(),
-            "issue": match.group("issue").strip(),
-            "pages": re.sub(r"\s+", "", match.group("pages")),
-        }
-
-    candidates = iter_candidates(search_lines)
-    for candidate in candidates:
-        match = _VOL_NO_PAGES_RE.search(candidate)
-        if not match:
-            continue
-        pages = match.group("pages") or ""
-        return {
-            "journal_name": _clean_journal_name(match.group("journal")),
-            "year": match.group("year").strip(),
-            "volume": match.group("volume").strip(),
-            "issue": match.group("issue").strip(),
-            "pages": re.sub(r"\s+", "", pages),
-        }
-
-    for candidate in candidates:
-        match = _CITATION_VOL_PAGES_YEAR_RE.search(candidate)
-        if not match:
-            continue
-        issue = (match.group("issue") or "").strip()
-        return {
-            "journal_name": _clean_journal_name(match.group("journal")),
-            "year": match.group("year").strip(),
-            "volume": match.group("volume").strip(),
-            "issue": issue,
-            "pages": re.sub(r"\s+", "", match.group("pages")),
-        }
-
-    for candidate in candidates:
-        match = _CITATION_RE.search(candidate)
-        if not match:
-            continue
-        return {
-            "journal_name": _clean_journal_name(match.group("journal")),
-            "year": match.group("year").strip(),
-            "volume": match.group("volume").strip(),
-            "issue": match.group("issue").strip(),
-            "pages": re.sub(r"\s+", "", match.group("pages")),
-        }
-    return {}
+    match = _first_citation_match(_iter_citation_candidates(primary_lines, primary_lines))
+    if not match:
+        # Everything built from the first 250 lines was already tried above.
+        tail = search_lines[249:]
+        match = _first_citation_match(_iter_citation_candidates(tail[1:], tail))
+    return _citation_fields(match) if match else {}
 
 
 def _extract_labeled_fields(text: str) -> dict[str, str]:
-    raw_lines = [line.rstrip("\n") for line in text.split("\n")]
-    front_lines: list[str] = []
-    for raw in raw_lines[:250]:
+    extracted: dict[str, str] = {}
+    for raw in text.split("\n", 250)[:250]:
         line = raw.strip()
         if not line:
             continue
-        if _FRONT_MATTER_STOP_RE.match(line):
-            break
-        front_lines.append(line)
-
-    label_re = re.compile(r"(?i)\b(Journal|Title|Type|Authors|Affiliations)\s*:\s*")
-    extracted: dict[str, str] = {}
-    for line in front_lines:
-        matches = list(label_re.finditer(line))
+        if ":" not in line:
+            # No "Label:" possible; only the anchored stop heading can match.
+            if _FRONT_MATTER_STOP_RE.match(line):
+                break
+            continue
+        # One scan per line finds both the front-matter stop heading (only
+        # possible at the start) and every "Label:" on the line.
+        matches = list(_FRONT_MATTER_SCAN_RE.finditer(line))
         if not matches:
             continue
+        if matches[0].lastgroup == "stop":
+            break
 
         for i, match in enumerate(matches):
-            key = match.group(1).lower()
+            field = _LABEL_FIELDS.get(match.group("label").lower())
             value_start = match.end()
             value_end = matches[i + 1].start() if i + 1 < len(matches) else len(line)
             value = line[value_start:value_end].strip()
-            if not value:
-                continue
-            if key == "journal":
-                extracted.setdefault("journal_raw", value)
-            elif key == "title":
-                extracted.setdefault("title", value)
-            elif key == "authors":
-                extracted.setdefault("authors", value)
-            elif key == "affiliations":
-                extracted.setdefault("affiliations", value)
+            if field and value:
+                extracted.setdefault(field, value)
 
     return extracted
 
 
 def _find_journal_name(lines: list[str]) -> str:
-    for line in lines[:40]:
-        if "journal" not in line.lower():
-            continue
-        candidate = line.strip()
-        if not candidate:
+    for line in itertools.islice(lines, 40):
+        lowered = line.lower()
+        if "journal" not in lowered:
             continue
-        if candidate.lower().startswith(("http://", "https://")):
+        lowered = lowered.strip()
+        if lowered.startswith(("http://", "https://")):
             continue
-        candidate = re.sub(r"https?://\S+", "", candidate).strip()
+        candidate = line.strip()
+        # _INLINE_URL_RE is case-sensitive, so only lines with "http" change.
+        if "http" in candidate:
+            candidate = _INLINE_URL_RE.sub("", candidate).strip()
+            lowered = candidate.lower()
         if not candidate:
             continue
         if len(candidate) > 120:
             continue
-        lowered = candidate.lower()
         if lowered.startswith("journal:"):
             continue
-        if any(x in lowered for x in ["title:", "authors:", "author:", "affiliations:", "affiliation:"]):
+        if _OTHER_LABEL_RE.search(lowered):
             continue
         if candidate and "journal" in lowered:
             return candidate
@@ -1014,7 +1060,7 @@ def _find_journal_name(lines: list[str]) -> str:
 
 
 def _find_title(lines: list[str]) -> str:
-    for i, line in enumerate(lines[:120]):
+    for i, line in enumerate(itertools.islice(lines, 120)):
         if not _ARTICLE_TYPE_HINT_RE.search(line):
             continue
         title_lines: list[str] = []
@@ -1025,7 +1071,7 @@ def _find_title(lines: list[str]) -> str:
                     break
                 continue
             lowered = candidate.lower()
-            if any(x in lowered for x in ["http", "doi", "creativecommons"]):
+            if _LINK_OR_CC_RE.search(lowered):
                 continue
             if lowered.startswith(("abstract", "keywords", "references")):
                 break
@@ -1047,12 +1093,12 @@ def _find_title(lines: list[str]) -> str:
             if len(title_lines) >= 6:
                 break
         if title_lines:
-            merged = re.sub(r"\s+", " ", " ".join(title_lines)).strip()
+            merged = " ".join(" ".join(title_lines).split())
             if len(merged) >= 10:
                 return merged
 
     stop_idx = len(lines)
-    for i, line in enumerate(lines[:60]):
+    for i, line in enumerate(itertools.islice(lines, 60)):
         heading = _canonical_heading(line)
         if heading in {
             "abstract",
@@ -1080,7 +1126,7 @@ def _find_title(lines: list[str]) -> str:
                 break
             continue
         lowered = candidate.lower()
-        if any(x in lowered for x in ["http", "doi", "creativecommons", "license"]):
+        if _LINK_OR_LICENSE_RE.search(lowered):
             continue
         if candidate.isupper() and "journal" in lowered:
             continue
@@ -1100,61 +1146,48 @@ def _find_title(lines: list[str]) -> str:
             break
 
     if title_lines:
-        merged = re.sub(r"\s+", " ", " ".join(title_lines)).strip()
+        merged = " ".join(" ".join(title_lines).split())
         if len(merged) >= 10:
             return merged
 
-    candidates: list[str] = []
-    for line in lines[:80]:
+    # Keep the first of the longest remaining lines, as max() would.
+    longest = ""
+    for line in itertools.islice(lines, 80):
         candidate = line.strip()
-        if len(candidate) < 10:
+        if len(candidate) < 10 or len(candidate) <= len(longest):
             continue
         lowered = candidate.lower()
-        if any(
-            x in lowered
-            for x in [
-                "http",
-                "doi",
-                "creativecommons",
-                "license",
-                "received",
-                "accepted",
-                "conflict",
-                "keywords",
-                "abstract",
-                "references",
-            ]
-        ):
+        if _TITLE_REJECT_RE.search(lowered):
             continue
-        if _CITATION_RE.search(candidate):
+        # _CITATION_RE needs a 20xx year; skip its backtracking otherwise.
+        if "20" in candidate and _CITATION_RE.search(candidate):
             continue
         if _looks_like_affiliation_line(candidate):
             continue
         if candidate.isupper() and "journal" in lowered:
             continue
-        candidates.append(candidate)
+        longest = candidate
+    return longest
 
-    if not candidates:
-        return ""
-    return max(candidates, key=lambda s: len(s))
+
+def _index_in_head(lines: list[str], value: str, limit: int) -> int:
+    try:
+        return lines.index(value, 0, limit)
+    except ValueError:
+        return -1
 
 
 def _find_authors(lines: list[str], title: str) -> str:
-    authors_label_re = re.compile(r"^\s*authors?\s*:\s*(?P<authors>.+?)\s*$", re.IGNORECASE)
-    for line in lines[:200]:
-        match = authors_label_re.match(line)
+    for line in itertools.islice(lines, 200):
+        match = _AUTHORS_LABEL_RE.match(line)
         if match:
             return match.group("authors").strip()
 
-    title_idx = -1
-    for i, line in enumerate(lines[:200]):
-        if title and line.strip() == title.strip():
-            title_idx = i
-            break
+    # Lines arrive stripped, so the exact title match is a C-level list.index.
+    title_idx = _index_in_head(lines, title.strip(), 200) if title else -1
+    title_lower = title.lower()
     if title_idx < 0 and title:
-        title_lower = title.lower()
-        for i, line in enumerate(lines[:200]):
-            candidate = line.strip()
+        for i, candidate in enumerate(itertools.islice(lines, 200)):
             if len(candidate) < 10:
                 continue
             if candidate.lower() in title_lower:
@@ -1166,39 +1199,27 @@ def _find_authors(lines: list[str], title: str) -> str:
     candidate_lines: list[str] = []
     for line in window:
         trimmed = line.strip()
-        if title and len(trimmed) >= 10 and trimmed.lower() in title.lower():
-            continue
         lowered = trimmed.lower()
-        if any(x in lowered for x in ["http", "doi"]):
+        if title and len(trimmed) >= 10 and lowered in title_lower:
+            continue
+        if _LINK_RE.search(lowered):
             continue
         if _ARTICLE_TYPE_HINT_RE.search(trimmed):
             continue
         if lowered.startswith(("abstract", "keywords")):
             break
-        if any(x in lowered for x in ["received", "accepted", "conflict", "copyright", "creativecommons"]):
+        if _AUTHORS_STOP_RE.search(lowered):
             break
-        if _looks_like_affiliation_line(line) and any(
-            k in lowered
-            for k in [
-                "department",
-                "hospital",
-                "university",
-                "medical center",
-                "medical centre",
-                "institute",
-                "centre",
-                "center",
-                "clinic",
-            ]
-        ):
+        if _looks_like_affiliation_line(line) and _INSTITUTION_RE.search(lowered):
             break
         candidate_lines.append(trimmed)
 
     raw = " ".join(part for part in candidate_lines if part)
-    raw = _EMAIL_RE.sub("", raw)
-    raw = re.sub(r"(?:\b\d+\)\s*)+", "", raw)
-    raw = re.sub(r"\d+", "", raw)
-    raw = re.sub(r"\s+", " ", raw).strip(" -–—―")
+    if "@" in raw:
+        raw = _EMAIL_RE.sub("", raw)
+    # Affiliation markers ("1) 2)") and bare digits go in one pass; whitespace
+    # is collapsed afterwards so runs left around removed digits merge too.
+    raw = " ".join(_AUTHOR_NUMBERS_RE.sub("", raw).split()).strip(" -–—―")
     if raw and len(raw.split()) >= 2 and len(raw) <= 200:
         return raw
 
@@ -1207,12 +1228,9 @@ def _find_authors(lines: list[str], title: str) -> str:
         if not candidate:
             continue
         lowered = candidate.lower()
-        if any(
-            x in lowered
-            for x in ["department", "hospital", "university", "abstract", "keywords", "received", "accepted"]
-        ):
+        if _AUTHORS_REJECT_RE.search(lowered):
             continue
-        if re.search(r"\d", candidate) or re.search(r"\b\d+\)\b", candidate):
+        if _DIGITS_RE.search(candidate):
             continue
         if len(candidate.split()) < 2:
             continue
@@ -1223,12 +1241,12 @@ def _find_authors(lines: list[str], title: str) -> str:
     return ""
 
 def _extract_first_author(authors: str) -> str:
-    authors = re.sub(r"\s+", " ", authors).strip()
+    authors = " ".join(authors.split())
     if not authors:
         return ""
     if "," in authors:
         return authors.split(",", 1)[0].strip().strip(",;")
-    match = re.split(r"\s+(?:and|&)\s+", authors, maxsplit=1, flags=re.IGNORECASE)
+    match = _AUTHOR_AND_SPLIT_RE.split(authors, maxsplit=1)
     if match and match[0] and match[0] != authors:
         return match[0].strip().strip(",;")
     if ";" in authors:
@@ -1242,24 +1260,25 @@ def _parse_affiliations_map(affiliations: str) -> dict[int, str]:
     mapping: dict[int, str] = {}
     for part in affiliations.split("|"):
         part = part.strip()
-        match = re.match(r"^(?P<num>\d+)\)\s+(?P<rest>.+)$", part)
+        match = _AFF_ENTRY_RE.match(part)
         if not match:
             continue
         mapping[int(match.group("num"))] = match.group("rest").strip()
     return mapping
 
 
+@functools.lru_cache(maxsize=1024)
+def _first_author_aff_re(first_author: str) -> re.Pattern[str]:
+    return re.compile(rf"(?i){re.escape(first_author)}\s*(?P<nums>(?:\d+\s*\)?\s*)+)")
+
+
 def _extract_first_author_aff_nums(text: str, title: str, first_author: str) -> list[int]:
     if not first_author:
         return []
     text = _normalize_text(text)
     lines = [line.strip() for line in text.split("\n")]
 
-    title_idx = -1
-    for i, line in enumerate(lines[:300]):
-        if title and line.strip() == title.strip():
-            title_idx = i
-            break
+    title_idx = _index_in_head(lines, title.strip(), 300) if title else -1
 
     author_block_lines: list[str] = []
     if title_idx >= 0:
@@ -1269,23 +1288,18 @@ def _extract_first_author_aff_nums(text: str, title: str, first_author: str) ->
             lowered = line.lower().strip(":：")
             if lowered in _KNOWN_HEADINGS:
                 break
-            if re.match(r"^\d+\)\s+.+", line) and any(
-                k in lowered for k in ["department", "hospital", "university", "institute", "centre", "center", "clinic"]
-            ):
+            if _AFF_ENTRY_RE.match(line) and _INSTITUTION_RE.search(lowered):
                 break
             author_block_lines.append(line)
 
     search_text = " ".join(author_block_lines) if author_block_lines else " ".join(lines[:200])
     search_text = _EMAIL_RE.sub("", search_text)
-    search_text = re.sub(r"\s+", " ", search_text).strip()
+    search_text = " ".join(search_text.split())
 
-    pattern = re.compile(
-        rf"(?i){re.escape(first_author)}\s*(?P<nums>(?:\d+\s*\)?\s*)+)"
-    )
-    match = pattern.search(search_text)
+    match = _first_author_aff_re(first_author).search(search_text)
     if not match:
         return []
-    nums = [int(n) for n in re.findall(r"\d+", match.group("nums"))]
+    nums = [int(n) for n in _DIGITS_RE.findall(match.group("nums"))]
     deduped: list[int] = []
     for n in nums:
         if n not in deduped:
@@ -1296,11 +1310,11 @@ def _extract_first_author_aff_nums(text: str, title: str, first_author: str) ->
 def _infer_specialties_from_affiliations(affiliations_text: str) -> str:
     specialties: list[str] = []
     for aff in [a.strip() for a in affiliations_text.split("|") if a.strip()]:
-        match = re.search(r"(?i)\b(?:Department|Division|Section|Unit)\s+of\s+([^,]+)", aff)
+        match = _DEPT_OF_RE.search(aff)
         if match:
             specialties.append(match.group(1).strip())
             continue
-        match = re.search(r"(?i)\b([^,]+?)\s+Department\b", aff)
+        match = _X_DEPT_RE.search(aff)
         if match:
             specialties.append(match.group(1).strip())
             continue
@@ -1315,78 +1329,64 @@ def _infer_specialties_from_affiliations(affiliations_text: str) -> str:
     return " | ".join(deduped)
 
 
+def _extend_affiliation_block(raw: str, block_lines: list[str]) -> bool:
+    """Feed one line to the affiliation block scanner; False once the block has ended."""
+    line = " ".join(raw.split())
+    if not line:
+        return not block_lines
+    if _looks_like_affiliation_line(line):
+        block_lines.append(line)
+        return True
+    if not block_lines:
+        return True
+    lowered = line.lower()
+    if _canonical_heading(line) in _KNOWN_HEADINGS:
+        return False
+    if lowered.startswith(
+        ("received:", "accepted:", "advance publication", "correspondence", "http://", "https://", "doi:")
+    ):
+        return False
+    if _is_layout_noise_line(line):
+        return False
+    if "correspond" in lowered:
+        return False
+    if len(line) <= 120 and not line.endswith(".") and _AFF_BLOCK_KEYWORDS_RE.search(lowered):
+        block_lines.append(line)
+        return True
+    return False
+
+
 def _find_affiliations(lines: list[str]) -> str:
+    # One pass: numbered "1) ..." entries from the first 250 lines, with the
+    # block scanner as the fallback only while nothing numbered has been found.
     collected: list[str] = []
-    for line in lines[:250]:
-        collected.extend(_split_affiliations_from_line(line))
-
-    if not collected:
-        block_lines: list[str] = []
-        in_block = False
-        for raw in lines[:400]:
-            line = re.sub(r"\s+", " ", raw.strip())
-            if not line:
-                if in_block:
-                    break
-                continue
-            lowered = line.lower()
-            if _looks_like_affiliation_line(line):
-                block_lines.append(line)
-                in_block = True
-                continue
-            if not in_block:
-                continue
-            if _canonical_heading(line) in _KNOWN_HEADINGS:
-                break
-            if lowered.startswith(("received:", "accepted:", "advance publication", "correspondence")):
-                break
-            if lowered.startswith(("http://", "https://", "doi:")):
-                break
-            if _is_layout_noise_line(line):
-                break
-            if "correspond" in lowered:
-                break
-            if len(line) <= 120 and not line.endswith(".") and any(
-                k in lowered
-                for k in [
-                    "department",
-                    "division",
-                    "faculty",
-                    "school",
-                    "university",
-                    "hospital",
-                    "medical center",
-                    "medical centre",
-                    "centre",
-                    "center",
-                    "clinic",
-                    "institute",
-                    "laboratory",
-                    "program",
-                    "japan",
-                ]
-            ):
-                block_lines.append(line)
-                continue
+    block_lines: list[str] = []
+    block_open = True
+    for i, raw in enumerate(itertools.islice(lines, 400)):
+        if i < 250:
+            collected.extend(_split_affiliations_from_line(raw))
+        elif collected or not block_open:
             break
-
-        if block_lines:
-            entries: list[str] = []
-            for line in block_lines:
-                match = re.match(r"^(?P<num>\d+)\s*(?:\)|[).]|,)?\s*(?P<rest>.+)$", line)
-                if match:
-                    entries.append(f"{match.group('num')}) {match.group('rest').strip()}")
-                elif entries:
-                    entries[-1] = f"{entries[-1]} {line}".strip()
-            collected = entries
+        if block_open and not collected:
+            block_open = _extend_affiliation_block(raw, block_lines)
+
+    if not collected and block_lines:
+        entries: list[str] = []
+        for line in block_lines:
+            match = _AFF_NUM_PREFIX_RE.match(line)
+            if match:
+                entries.append(f"{match.group('num')}) {match.group('rest').strip()}")
+            elif entries:
+                entries[-1] = f"{entries[-1]} {line}".strip()
+        collected = entries
 
     cleaned: list[str] = []
     seen: set[str] = set()
     for entry in collected:
-        entry = re.sub(r"\s+", " ", entry).strip()
+        entry = " ".join(entry.split())
         if not entry or entry in seen:
             continue
-        match = re.match(r"^(?P<num>\d+)\s*(?:\)|[.)]|,)?\s*(?P<rest>.+)$", entry)
+        match = _AFF_NUM_PREFIX_RE.match(entry)
         if match:
             rest = match.group("rest").strip()
             if rest.lower().endswith(" and"):
@@ -1396,25 +1396,7 @@ def _find_affiliations(lines: list[str]) -> str:
             rest_lower = rest.lower()
             if rest_lower.startswith("and "):
                 continue
-            if not any(
-                k in rest_lower
-                for k in [
-                    "department",
-                    "division",
-                    "faculty",
-                    "school",
-                    "university",
-                    "hospital",
-                    "medical center",
-                    "medical centre",
-                    "institute",
-                    "centre",
-                    "center",
-                    "clinic",
-                    "laboratory",
-                    "research",
-                ]
-            ) and not ("," in rest and len(rest) >= 20):
+            if not _AFF_KEYWORDS_RE.search(rest_lower) and not ("," in rest and len(rest) >= 20):
                 continue
         seen.add(entry)
         cleaned.append(entry)
@@ -1424,14 +1406,13 @@ def _find_affiliations(lines: list[str]) -> str:
 
 def extract_metadata(text: str) -> dict[str, str]:
     text = _normalize_text(text)
-    lines = [line.strip() for line in text.split("\n")]
-    lines = [line for line in lines if line]
+    lines = [stripped for line in text.split("\n") if (stripped := line.strip())]
 
     doi = _extract_doi(text)
     labeled = _extract_labeled_fields(text)
 
     front_end = len(lines)
-    for i, line in enumerate(lines[:300]):
+    for i, line in enumerate(itertools.islice(lines, 300)):
         if _canonical_heading(line) in {
             "abstract",
             "introduction",
@@ -1450,35 +1431,9 @@ def extract_metadata(text: str) -> dict[str, str]:
     if labeled.get("journal_raw"):
         for pat in (_VOL_NO_PAGES_RE, _CITATION_RE, _CITATION_VOL_PAGES_YEAR_RE):
             match = pat.search(labeled["journal_raw"])
-            if not match:
-                continue
-            if pat is _VOL_NO_PAGES_RE:
-                pages = match.group("pages") or ""
-                citation = {
-                    "journal_name": _clean_journal_name(match.group("journal")),
-                    "year": match.group("year").strip(),
-                    "volume": match.group("volume").strip(),
-                    "issue": match.group("issue").strip(),
-                    "pages": re.sub(r"\s+", "", pages),
-                }
-            elif pat is _CITATION_VOL_PAGES_YEAR_RE:
-                issue = (match.group("issue") or "").strip()
-                citation = {
-                    "journal_name": _clean_journal_name(match.group("journal")),
-                    "year": match.group("year").strip(),
-                    "volume": match.group("volume").strip(),
-                    "issue": issue,
-                    "pages": re.sub(r"\s+", "", match.group("pages")),
-                }
-            else:
-                citation = {
-                    "journal_name": _clean_journal_name(match.group("journal")),
-                    "year": match.group("year").strip(),
-                    "volume": match.group("volume").strip(),
-                    "issue": match.group("issue").strip(),
-                    "pages": re.sub(r"\s+", "", match.group("pages")),
-                }
-            break
+            if match:
+                citation = _citation_fields(match)
+                break
     if not citation:
         citation = _find_citation(lines)
 
@@ -1511,7 +1466,7 @@ def extract_structured_sections(clean_text: str) -> dict[str, str]:
     lines = [line.rstrip() for line in clean_text.split("\n")]
 
     def norm(line: str) -> str:
-        return re.sub(r"\s+", " ", line.strip()).strip(":：").lower()
+        return " ".join(line.split()).strip(":：").lower()
 
     def is_heading(line: str, names: set[str]) -> bool:
         n = norm(line)
@@ -1551,19 +1506,10 @@ def extract_structured_sections(clean_text: str) -> dict[str, str]:
         return _normalize_section_text(lines[start:end])
 
     def _normalize_section_text(section_lines: list[str]) -> str:
-        paragraphs: list[str] = []
-        cur: list[str] = []
-        for raw in section_lines:
-            line = raw.strip()
-            if not line:
-                if cur:
-                    paragraphs.append(re.sub(r"\s+", " ", " ".join(cur)).strip())
-                    cur = []
-                continue
-            cur.append(line)
-        if cur:
-            paragraphs.append(re.sub(r"\s+", " ", " ".join(cur)).strip())
-        return "\n\n".join(p for p in paragraphs if p)
+        # Whitespace-only lines separate paragraphs; split()/join collapses the
+        # rest of each paragraph's whitespace, newlines included.
+        paragraphs = _PARAGRAPH_BREAK_RE.split("\n".join(section_lines))
+        return "\n\n".join(p for p in (" ".join(para.split()) for para in paragraphs) if p)
 
     abstract = collect_between({"abstract"}, {"keywords", "key words", "introduction", "background", "references"})
     introduction = collect_between(
@@ -1592,7 +1538,7 @@ def extract_structured_sections(clean_text: str) -> dict[str, str]:
     if not (case_presentation and discussion):
         main_text = slice_main_text()
         if not discussion:
-            citation_match = re.search(r"\[\d+\]", main_text)
+            citation_match = _BRACKET_CITATION_RE.search(main_text)
             if citation_match:
                 split_at = citation_match.start()
                 paragraph_start = main_text.rfind("\n\n", 0, split_at)
@@ -1622,41 +1568,31 @@ def extract_structured_sections(clean_text: str) -> dict[str, str]:
     }
 
 
-_LEADING_CONNECTOR_RE = re.compile(
-    r"(?i)^(?:although|however|but|therefore|thus|then|instead|overall|given that|because|since|in this case|in the present case|in the current case|on day\s+\d+)\b[,:]?\s*"
+# One anchored pass strips any run of connectors, commas and whitespace.
+_LEADING_CONNECTORS_RE = re.compile(
+    r"(?i)^(?:(?:although|however|but|therefore|thus|then|instead|overall|given that|because|since|in this case|in the present case|in the current case|on day\s+\d+)\b[,:]?|[\s,])+"
 )
 
 
 def _dedupe_keep_order(items: list[str]) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
+    # Keyed on the lowercased form; setdefault keeps the first spelling seen.
+    first_seen: dict[str, str] = {}
     for item in items:
-        item = re.sub(r"\s+", " ", item).strip().strip(" ,;:-–—―")
-        if not item:
-            continue
-        key = item.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(item)
-    return out
+        item = " ".join(item.split()).strip(" ,;:-–—―")
+        if item:
+            first_seen.setdefault(item.lower(), item)
+    return list(first_seen.values())
 
 
 def _strip_leading_connectors(text: str) -> str:
     text = text.strip().strip(" ,;:-–—―")
-    while True:
-        updated = _LEADING_CONNECTOR_RE.sub("", text).strip()
-        updated = updated.lstrip(",").strip()
-        if updated == text:
-            return text
-        text = updated
+    return _LEADING_CONNECTORS_RE.sub("", text).strip()
 
 
 def _normalize_dx_key(dx: str) -> str:
     dx = dx.lower()
-    dx = re.sub(r"[^a-z0-9]+", " ", dx)
-    dx = re.sub(r"\s+", " ", dx).strip()
-    return dx
+    # Whitespace is outside [a-z0-9] too, so this already collapses it.
+    return _NON_ALNUM_RE.sub(" ", dx).strip()
 
 
 def _extract_preceding_phrase(text: str, match_start: int) -> str:
@@ -1684,10 +1620,16 @@ def _extract_preceding_phrase(text: str, match_start: int) -> str:
 
 
 def _extract_following_phrase(text: str, match_end: int) -> str:
-    tail = text[match_end:]
-    tail = re.sub(r"^\s+", "", tail)
-    tail = re.split(r"[.;\n]", tail, maxsplit=1)[0]
-    return tail.strip().strip(" ,;:-–—―")
+    # Find the phrase end in place instead of copying the rest of the text.
+    start = match_end
+    while start < len(text) and text[start].isspace():
+        start += 1
+    end = len(text)
+    for boundary in ".;\n":
+        pos = text.find(boundary, start, end)
+        if pos != -1:
+            end = pos
+    return text[start:end].strip().strip(" ,;:-–—―")
 
 
 def extract_diagnoses(sections: dict[str, str]) -> dict[str, str]:
@@ -1695,19 +1637,20 @@ def extract_diagnoses(sections: dict[str, str]) -> dict[str, str]:
     abstract_text = sections.get("abstract", "") or ""
     discussion_text = sections.get("discussion", "") or ""
 
-    tentative_source = re.sub(r"\s+", " ", case_text).strip()
-    final_source = re.sub(r"\s+", " ", "\n".join([case_text, abstract_text, discussion_text])).strip()
+    tentative_source = " ".join(case_text.split())
+    final_source = " ".join("\n".join([case_text, abstract_text, discussion_text]).split())
 
-    tentative: list[str] = []
-    for match in re.finditer(r"(?i)\b(?:was|were)\s+(?:also\s+)?considered\b", tentative_source):
-        dx = _extract_preceding_phrase(tentative_source, match.start())
-        tentative.append(dx)
-    for match in re.finditer(r"(?i)\b(?:was|were)\s+suspected\b", tentative_source):
-        dx = _extract_preceding_phrase(tentative_source, match.start())
-        tentative.append(dx)
-    for match in re.finditer(r"(?i)\bsuspicion\s+of\b", tentative_source):
-        dx = _extract_following_phrase(tentative_source, match.end())
-        tentative.append(dx)
+    # Bucket by cue so the candidate order (and which spelling the dedupe
+    # keeps) matches scanning for each cue in turn.
+    tentative_by_cue: dict[str, list[str]] = {"considered": [], "suspected": [], "suspicion": []}
+    for match in _TENTATIVE_DX_RE.finditer(tentative_source):
+        cue = match.lastgroup
+        if cue == "suspicion":
+            dx = _extract_following_phrase(tentative_source, match.end())
+        else:
+            dx = _extract_preceding_phrase(tentative_source, match.start())
+        tentative_by_cue[cue].append(dx)
+    tentative = list(itertools.chain.from_iterable(tentative_by_cue.values()))
 
     tentative = [
         dx
@@ -1718,26 +1661,19 @@ def extract_diagnoses(sections: dict[str, str]) -> dict[str, str]:
     ]
     tentative = _dedupe_keep_order(tentative)
 
-    final: list[str] = []
-    for match in re.finditer(
-        r"(?i)\b(?:was|were)\s+(?:promptly\s+|clinically\s+|presumptively\s+|ultimately\s+|definitively\s+|finally\s+)?diagnosed\b",
-        final_source,
-    ):
-        dx = _extract_preceding_phrase(final_source, match.start())
-        final.append(dx)
-    for match in re.finditer(r"(?i)\bdiagnosed\s+(?:with|as)\b", final_source):
-        dx = _extract_following_phrase(final_source, match.end())
-        final.append(dx)
-    for match in re.finditer(
-        r"(?i)\bconfirm(?:ed)?\s+(?:the\s+presence\s+of|presence\s+of|the\s+diagnosis\s+of|diagnosis\s+of)\s+",
-        final_source,
-    ):
-        dx = _extract_following_phrase(final_source, match.end())
-        final.append(dx)
-    for match in re.finditer(r"(?i)\b(?:revealed|identified)\s+(?:a|an)\s+", final_source):
-        dx = _extract_following_phrase(final_source, match.end())
-        if "mutation" in dx.lower() or "thromb" in dx.lower():
-            final.append(dx)
+    final_by_cue: dict[str, list[str]] = {"diagnosed": [], "diagnosed_with": [], "confirmed": [], "revealed": []}
+    for match in _FINAL_DX_RE.finditer(final_source):
+        cue = match.lastgroup
+        if cue == "diagnosed":
+            dx = _extract_preceding_phrase(final_source, match.start())
+        else:
+            dx = _extract_following_phrase(final_source, match.end())
+            if cue == "revealed":
+                dx_lower = dx.lower()
+                if "mutation" not in dx_lower and "thromb" not in dx_lower:
+                    continue
+        final_by_cue[cue].append(dx)
+    final = list(itertools.chain.from_iterable(final_by_cue.values()))
 
     final = [
         dx
@@ -1772,69 +1708,360 @@ def extract_diagnoses(sections: dict[str, str]) -> dict[str, str]:
     }
 
 
-def write_csv(rows: list[dict[str, str]], csv_path: Path) -> None:
+_CSV_FIELDNAMES = (
+    "pdf_path",
+    "txt_path",
+    "paper_title",
+    "journal_name",
+    "year",
+    "volume",
+    "issue",
+    "pages",
+    "authors",
+    "first_author",
+    "first_author_affiliations",
+    "first_author_specialties",
+    "tentative_diagnoses",
+    "final_diagnoses",
+    "affiliations",
+    "doi",
+    "extracted_at",
+    "extractor",
+    "abstract",
+    "introduction",
+    "case_presentation",
+    "discussion",
+    "figure_legends",
+    "full_text",
+)
+_CSV_HEADER = ",".join('"' + name + '"' for name in _CSV_FIELDNAMES) + "\r\n"
+
+
+def _csv_quote(value: object) -> str:
+    # Same bytes as csv.QUOTE_ALL with doublequote=True: every field is quoted
+    # and embedded quotes are doubled, so no per-character escape scan is needed.
+    text = "" if value is None else str(value)
+    return '"' + text.replace('"', '""') + '"'
+
+
+def write_csv(rows: Iterable[dict[str, str]], csv_path: Path) -> None:
     csv_path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = [
-        "pdf_path",
-        "txt_path",
-        "paper_title",
-        "journal_name",
-        "year",
-        "volume",
-        "issue",
-        "pages",
-        "authors",
-        "first_author",
-        "first_author_affiliations",
-        "first_author_specialties",
-        "tentative_diagnoses",
-        "final_diagnoses",
-        "affiliations",
-        "doi",
-        "extracted_at",
-        "extractor",
-        "abstract",
-        "introduction",
-        "case_presentation",
-        "discussion",
-        "figure_legends",
-        "full_text",
-    ]
-    # Use UTF-8 with BOM so Excel (JP) opens without mojibake (Shift-JIS mis-detection).
-    with csv_path.open("w", encoding="utf-8-sig", newline="") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=fieldnames,
-            extrasaction="ignore",
-            quoting=csv.QUOTE_ALL,
-            lineterminator="\r\n",
-        )
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+    # Rows may be a generator that is still extracting PDFs, so write to a
+    # sibling temp file and swap it in at the end; an interrupted run leaves
+    # the previous CSV intact instead of a truncated one.
+    tmp_path = csv_path.with_name(csv_path.name + ".tmp")
+    try:
+        # Use UTF-8 with BOM so Excel (JP) opens without mojibake (Shift-JIS mis-detection).
+        with tmp_path.open("w", encoding="utf-8-sig", newline="") as f:
+            f.write(_CSV_HEADER)
+            for row in rows:
+                f.write(",".join([_csv_quote(row.get(name, "")) for name in _CSV_FIELDNAMES]) + "\r\n")
+        tmp_path.replace(csv_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def _utc_now_iso() -> str:
-    ts = time.time()
-    seconds = int(ts)
-    micros = int(round((ts - seconds) * 1_000_000))
-    if micros >= 1_000_000:
-        seconds += 1
-        micros = 0
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
     base = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
-    return f"{base}.{micros:06d}Z"
+    return f"{base}.{nanos // 1000:06d}Z"
+
 
+def _pdf_state(pdf_path: Path) -> tuple[str, int, int] | None:
+    try:
+        stat = pdf_path.stat()
+    except FileNotFoundError:
+        return None
+    # abspath is string-only; the key just has to be stable between polls.
+    return (os.path.abspath(pdf_path), int(stat.st_size), int(stat.st_mtime_ns))
 
-def _pdf_states(pdfs: list[Path]) -> list[tuple[str, int, int]]:
-    states: list[tuple[str, int, int]] = []
+
+def _pdf_states(pdfs: list[Path]) -> dict[str, tuple[int, int]]:
+    # Keyed by path so two polls compare without sorting and process_pdfs
+    # can look up a PDF's state instead of stat()ing it again.
+    states: dict[str, tuple[int, int]] = {}
     for pdf_path in pdfs:
+        state = _pdf_state(pdf_path)
+        if state is not None:
+            states[state[0]] = (state[1], state[2])
+    return states
+
+
+def _start_pdf_observer(input_dir: Path, changed: threading.Event) -> object | None:
+    # Event-driven --watch when watchdog is installed; None means fall back to polling.
+    try:
+        from watchdog.events import FileSystemEventHandler  # type: ignore
+        from watchdog.observers import Observer  # type: ignore
+    except Exception:
+        return None
+
+    def on_any_event(event: object) -> None:
+        # Ignore opened/closed events: our own extraction reads the PDFs.
+        event_type = getattr(event, "event_type", "")
+        if event_type not in {"created", "modified", "moved", "deleted"}:
+            return
+        if getattr(event, "is_directory", False):
+            if event_type in {"moved", "deleted"}:
+                changed.set()
+            return
+        paths = (getattr(event, "src_path", ""), getattr(event, "dest_path", ""))
+        if any(str(path).lower().endswith(".pdf") for path in paths):
+            changed.set()
+
+    handler = FileSystemEventHandler()
+    handler.on_any_event = on_any_event
+    observer = Observer()
+    try:
+        observer.schedule(handler, str(input_dir), recursive=True)
+        observer.start()
+    except OSError:
+        return None
+    return observer
+
+
+def _wait_for_pdf_events(changed: threading.Event) -> None:
+    changed.wait()
+    # Coalesce bursts (a copy emits several events per file) until things go quiet.
+    while True:
+        changed.clear()
+        if not changed.wait(_WATCH_DEBOUNCE_SECONDS):
+            return
+
+
+def _read_meta(meta_path: Path) -> dict[str, str]:
+    try:
+        if orjson is not None:
+            try:
+                cached = orjson.loads(meta_path.read_bytes())
+            except orjson.JSONDecodeError:
+                # orjson rejects invalid UTF-8; let json decide with replacement chars.
+                cached = json.loads(meta_path.read_text(encoding="utf-8", errors="replace"))
+        else:
+            cached = json.loads(meta_path.read_text(encoding="utf-8", errors="replace"))
+    except Exception:
+        return {}
+    if not isinstance(cached, dict):
+        return {}
+    return {str(k): str(v) for k, v in cached.items()}
+
+
+# Output directories already created during this process_pdfs run; most
+# PDFs share a parent, so mkdir only has to hit the filesystem once per dir.
+_created_dirs: set[Path] = set()
+
+
+def _ensure_parent_dir(path: Path) -> None:
+    parent = path.parent
+    if parent not in _created_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(parent)
+
+
+def _read_cached_txt(out_path: Path) -> str:
+    # Same result as read_text(encoding="utf-8-sig", errors="replace") but
+    # skips the text-mode layer; our own .txt files never contain "\r".
+    with out_path.open("rb") as f:
+        text = f.read().decode("utf-8-sig", "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _write_meta(meta_path: Path, metadata: dict[str, str]) -> None:
+    if orjson is not None:
+        data = orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(metadata, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+    # Swap in a complete file: a meta truncated by a crash would read back
+    # as {} and silently defeat the size/mtime/hash cache checks.
+    tmp_path = meta_path.with_name(meta_path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        tmp_path.replace(meta_path)
+    except OSError:
+        pass
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _first_author_fields(metadata: dict[str, str], cleaned_text: str) -> dict[str, str]:
+    first_author = _extract_first_author(metadata.get("authors", ""))
+    aff_map = _parse_affiliations_map(metadata.get("affiliations", ""))
+    first_aff_nums = _extract_first_author_aff_nums(cleaned_text, metadata.get("paper_title", ""), first_author)
+    if not first_aff_nums and aff_map:
+        first_aff_nums = [sorted(aff_map.keys())[0]]
+    first_affs = " | ".join(aff_map.get(n, "").strip() for n in first_aff_nums if aff_map.get(n, "").strip())
+    return {
+        "first_author": first_author,
+        "first_author_affiliations": first_affs,
+        "first_author_specialties": _infer_specialties_from_affiliations(first_affs),
+    }
+
+
+def _process_one(
+    pdf_path: Path,
+    input_root: Path,
+    txt_out: Path,
+    want_csv: bool,
+    force: bool,
+    extracted_at: str,
+) -> tuple[dict[str, str] | None, Path, Path, bool]:
+    out_path, meta_path = _output_paths_for_pdf(pdf_path, input_root, txt_out)
+    wrote_txt = False
+    figure_legends = ""
+    pdf_stat = pdf_path.stat()
+    pdf_size = int(pdf_stat.st_size)
+    pdf_mtime_ns = int(pdf_stat.st_mtime_ns)
+    pdf_sha256 = ""
+
+    cached_meta: dict[str, str] | None = None
+    # One stat answers both "does the .txt exist" and "is it newer".
+    out_mtime_ns = -1
+    if not force:
         try:
-            stat = pdf_path.stat()
+            out_mtime_ns = int(out_path.stat().st_mtime_ns)
         except FileNotFoundError:
-            continue
-        states.append((str(pdf_path.resolve()), int(stat.st_size), int(stat.st_mtime_ns)))
-    states.sort()
-    return states
+            pass
+    needs_extract = out_mtime_ns < 0
+    if not needs_extract:
+        if out_mtime_ns >= pdf_mtime_ns:
+            needs_extract = False
+        else:
+            cached_meta = _read_meta(meta_path)
+            meta_sha256 = cached_meta.get("source_pdf_sha256", "")
+            meta_size = int(cached_meta.get("source_pdf_size", "0") or "0")
+            if meta_size == pdf_size and cached_meta.get("source_pdf_mtime_ns") == str(pdf_mtime_ns):
+                # Same size and mtime as when the meta was written: trust it
+                # without reading the PDF.
+                needs_extract = False
+            elif meta_sha256 and meta_size == pdf_size:
+                try:
+                    pdf_sha256 = _sha256_file(pdf_path)
+                except OSError:
+                    pdf_sha256 = ""
+                needs_extract = not (pdf_sha256 and pdf_sha256 == meta_sha256)
+                if not needs_extract:
+                    # Touched but unchanged: record the new mtime so the next
+                    # run takes the fast path above instead of hashing again.
+                    cached_meta["source_pdf_mtime_ns"] = str(pdf_mtime_ns)
+                    _write_meta(meta_path, cached_meta)
+            else:
+                needs_extract = True
+
+    if not needs_extract:
+        if not want_csv:
+            return None, out_path, meta_path, False
+        cleaned_text = _read_cached_txt(out_path)
+        extractor = "txt-cache"
+    else:
+        raw_text, extractor = extract_text(pdf_path)
+        if want_csv:
+            figure_legends = extract_figure_legends(raw_text)
+        cleaned_text = clean_extracted_text(raw_text)
+        text_sha256 = hashlib.sha256(cleaned_text.encode("utf-8")).hexdigest()
+        # A modified PDF often cleans to the same text; leave that .txt (and
+        # its mtime) alone so tools watching the output are not retriggered.
+        if not (cached_meta and cached_meta.get("cleaned_text_sha256") == text_sha256):
+            _ensure_parent_dir(out_path)
+            out_path.write_text(cleaned_text, encoding="utf-8-sig", newline="\n")
+            wrote_txt = True
+        # A touched PDF whose hash no longer matched the meta was hashed
+        # above already; only hash here if that did not happen.
+        if not pdf_sha256:
+            try:
+                pdf_sha256 = _sha256_file(pdf_path)
+            except OSError:
+                pdf_sha256 = ""
+
+    metadata: dict[str, str] = {}
+    if needs_extract:
+        metadata = extract_metadata(raw_text)
+        if want_csv:
+            # Stored even when empty so a PDF without legends is not
+            # re-parsed on every cache hit looking for them.
+            metadata["figure_legends"] = figure_legends
+        metadata["source_pdf_path"] = str(pdf_path)
+        metadata["source_pdf_size"] = str(pdf_size)
+        metadata["source_pdf_mtime_ns"] = str(pdf_mtime_ns)
+        if pdf_sha256:
+            metadata["source_pdf_sha256"] = pdf_sha256
+        metadata["cleaned_text_sha256"] = text_sha256
+        _write_meta(meta_path, metadata)
+    else:
+        metadata = cached_meta if cached_meta is not None else _read_meta(meta_path)
+        if not metadata:
+            metadata = extract_metadata(cleaned_text)
+
+        if want_csv:
+            figure_legends = metadata.get("figure_legends", "")
+
+        # A meta written after a full extraction already reflects the whole
+        # PDF; re-parsing it would find the same missing fields again.
+        needs_meta_refresh = "source_pdf_mtime_ns" not in metadata and (
+            not metadata.get("year") or not metadata.get("journal_name")
+        )
+        needs_fig_refresh = want_csv and "figure_legends" not in metadata
+        if needs_meta_refresh or needs_fig_refresh:
+            cached_figures = metadata.get("figure_legends")
+            pdf_text, meta_extractor = extract_text(pdf_path)
+            if needs_meta_refresh:
+                metadata = extract_metadata(pdf_text)
+                if cached_figures is not None:
+                    metadata["figure_legends"] = cached_figures
+                metadata["source_pdf_path"] = str(pdf_path)
+                metadata["source_pdf_size"] = str(pdf_size)
+                metadata["source_pdf_mtime_ns"] = str(pdf_mtime_ns)
+            if needs_fig_refresh:
+                figure_legends = extract_figure_legends(pdf_text)
+                metadata["figure_legends"] = figure_legends
+            if needs_meta_refresh and needs_fig_refresh:
+                extractor = f"txt-cache+{meta_extractor}-meta+fig"
+            elif needs_meta_refresh:
+                extractor = f"txt-cache+{meta_extractor}-meta"
+            else:
+                extractor = f"txt-cache+{meta_extractor}-fig"
+            _write_meta(meta_path, metadata)
+
+    if not want_csv:
+        return None, out_path, meta_path, wrote_txt
+
+    sections = extract_structured_sections(cleaned_text)
+    diagnoses = extract_diagnoses(sections)
+
+    row = {
+        "pdf_path": str(pdf_path),
+        "txt_path": str(out_path),
+        "extracted_at": extracted_at,
+        "extractor": extractor,
+        "full_text": cleaned_text,
+        **metadata,
+        **_first_author_fields(metadata, cleaned_text),
+        **diagnoses,
+        **sections,
+    }
+    return row, out_path, meta_path, wrote_txt
+
+
+def _process_front_matter(
+    pdf_path: Path,
+    input_root: Path,
+    txt_out: Path,
+    extracted_at: str,
+) -> tuple[dict[str, str] | None, Path, Path, bool]:
+    # --metadata-only: read just the first pages and leave .txt/.meta.json
+    # untouched, since a partial extraction must not be mistaken for a cache.
+    out_path, meta_path = _output_paths_for_pdf(pdf_path, input_root, txt_out)
+    raw_text, extractor = extract_front_matter_text(pdf_path)
+    metadata = extract_metadata(raw_text)
+    row = {
+        "pdf_path": str(pdf_path),
+        "txt_path": "",
+        "extracted_at": extracted_at,
+        "extractor": f"{extractor}-front",
+        **metadata,
+        **_first_author_fields(metadata, clean_extracted_text(raw_text)),
+    }
+    return row, out_path, meta_path, False
 
 
 def process_pdfs(
@@ -1844,6 +2071,10 @@ def process_pdfs(
     csv_out: Path | None,
     force: bool,
     sync_output: bool,
+    jobs: int = 1,
+    row_cache: dict[tuple[str, int, int], dict[str, str]] | None = None,
+    metadata_only: bool = False,
+    pdf_states: dict[str, tuple[int, int]] | None = None,
 ) -> None:
     if not pdfs:
         if csv_out:
@@ -1856,158 +2087,104 @@ def process_pdfs(
     txt_out.mkdir(parents=True, exist_ok=True)
 
     extracted_at = _utc_now_iso()
-    rows: list[dict[str, str]] = []
     expected_outputs: set[Path] = set()
 
-    for pdf_path in pdfs:
-        out_path, meta_path = _output_paths_for_pdf(pdf_path, input_root, txt_out)
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        expected_outputs.add(out_path)
-        expected_outputs.add(meta_path)
-        wrote_txt = False
-        figure_legends = ""
-        pdf_stat = pdf_path.stat()
-        pdf_size = int(pdf_stat.st_size)
-        pdf_mtime_ns = int(pdf_stat.st_mtime_ns)
-        pdf_sha256 = ""
-
-        needs_extract = force or not out_path.exists()
-        if not needs_extract:
-            try:
-                out_mtime_ns = int(out_path.stat().st_mtime_ns)
-            except FileNotFoundError:
-                out_mtime_ns = 0
-            if out_mtime_ns >= pdf_mtime_ns:
-                needs_extract = False
+    # In --watch mode the caller keeps rows from earlier runs keyed by PDF
+    # state, so only new or modified PDFs go through extraction again.
+    cached_results: dict[int, tuple[dict[str, str] | None, Path, Path, bool]] = {}
+    state_keys: list[tuple[str, int, int] | None] = [None] * len(pdfs)
+    if row_cache is not None and csv_out:
+        for i, pdf_path in enumerate(pdfs):
+            if pdf_states is None:
+                state_keys[i] = _pdf_state(pdf_path)
             else:
-                cached_meta: dict[str, str] = {}
-                if meta_path.exists():
-                    try:
-                        cached = json.loads(meta_path.read_text(encoding="utf-8", errors="replace"))
-                        if isinstance(cached, dict):
-                            cached_meta = {str(k): str(v) for k, v in cached.items()}
-                    except Exception:
-                        cached_meta = {}
-                meta_sha256 = cached_meta.get("source_pdf_sha256", "")
-                meta_size = int(cached_meta.get("source_pdf_size", "0") or "0")
-                if meta_sha256 and meta_size == pdf_size:
-                    try:
-                        pdf_sha256 = _sha256_file(pdf_path)
-                    except OSError:
-                        pdf_sha256 = ""
-                    needs_extract = not (pdf_sha256 and pdf_sha256 == meta_sha256)
-                else:
-                    needs_extract = True
-
-        if not needs_extract:
-            if not csv_out:
+                key = os.path.abspath(pdf_path)
+                size_mtime = pdf_states.get(key)
+                state_keys[i] = (key, *size_mtime) if size_mtime is not None else None
+            cached_row = row_cache.get(state_keys[i]) if state_keys[i] else None
+            if cached_row is None:
                 continue
-            cleaned_text = out_path.read_text(encoding="utf-8-sig", errors="replace")
-            extractor = "txt-cache"
-        else:
-            raw_text, extractor = extract_text(pdf_path)
-            if csv_out:
-                figure_legends = extract_figure_legends(raw_text)
-            cleaned_text = clean_extracted_text(raw_text)
-            out_path.write_text(cleaned_text, encoding="utf-8-sig", newline="\n")
-            wrote_txt = True
-            try:
-                pdf_sha256 = _sha256_file(pdf_path)
-            except OSError:
-                pdf_sha256 = ""
+            out_path, meta_path = _output_paths_for_pdf(pdf_path, input_root, txt_out)
+            if metadata_only:
+                row = {**cached_row, "extracted_at": extracted_at}
+            elif out_path.exists():
+                row = {**cached_row, "extracted_at": extracted_at, "extractor": "txt-cache"}
+            else:
+                continue
+            cached_results[i] = (row, out_path, meta_path, False)
+    todo = [pdf_path for i, pdf_path in enumerate(pdfs) if i not in cached_results]
+
+    if metadata_only:
+        worker = functools.partial(
+            _process_front_matter,
+            input_root=input_root,
+            txt_out=txt_out,
+            extracted_at=extracted_at,
+        )
+    else:
+        worker = functools.partial(
+            _process_one,
+            input_root=input_root,
+            txt_out=txt_out,
+            want_csv=bool(csv_out),
+            force=force,
+            extracted_at=extracted_at,
+        )
+    # Each PDF is independent (extraction subprocess + pure-Python parsing), so
+    # fan out across processes and collect results in input order.
+    executor: ProcessPoolExecutor | None = None
+    if jobs > 1 and len(todo) > 1:
+        # Never start more workers than there are PDFs left to extract.
+        workers = min(jobs, len(todo))
+        executor = ProcessPoolExecutor(max_workers=workers)
+        # Batch tasks to amortize IPC on large trees, but keep roughly four
+        # batches per worker so one slow PDF cannot leave the others idle.
+        chunksize = max(1, min(8, len(todo) // (workers * 4)))
+        computed = executor.map(worker, todo, chunksize=chunksize)
+    else:
+        computed = map(worker, todo)
+
+    refreshed_cache: dict[tuple[str, int, int], dict[str, str]] = {}
+
+    # Rows are handed to the CSV writer as they arrive, so only the row
+    # cache (watch mode) ever holds more than one PDF's full text at a time.
+    def iter_rows() -> Iterator[dict[str, str]]:
+        for i in range(len(pdfs)):
+            result = cached_results.get(i) or next(computed)
+            row, out_path, meta_path, wrote_txt = result
+            expected_outputs.add(out_path)
+            expected_outputs.add(meta_path)
+            if wrote_txt:
+                print(out_path)
+            if row is not None:
+                if state_keys[i] is not None:
+                    refreshed_cache[state_keys[i]] = row
+                yield row
 
-        metadata: dict[str, str] = {}
-        if needs_extract:
-            metadata = extract_metadata(raw_text)
-            if csv_out and figure_legends:
-                metadata["figure_legends"] = figure_legends
-            metadata["source_pdf_path"] = str(pdf_path)
-            metadata["source_pdf_size"] = str(pdf_size)
-            metadata["source_pdf_mtime_ns"] = str(pdf_mtime_ns)
-            if pdf_sha256:
-                metadata["source_pdf_sha256"] = pdf_sha256
-            try:
-                meta_path.write_text(
-                    json.dumps(metadata, ensure_ascii=False, indent=2) + "\n",
-                    encoding="utf-8",
-                    newline="\n",
-                )
-            except OSError:
-                pass
+    try:
+        if csv_out:
+            write_csv(iter_rows(), csv_out)
         else:
-            if meta_path.exists():
-                try:
-                    cached = json.loads(meta_path.read_text(encoding="utf-8", errors="replace"))
-                    if isinstance(cached, dict):
-                        metadata = {str(k): str(v) for k, v in cached.items()}
-                except Exception:
-                    metadata = {}
-
-            if not metadata:
-                metadata = extract_metadata(raw_text)
-
-            if csv_out:
-                figure_legends = metadata.get("figure_legends", "")
-
-            needs_meta_refresh = not metadata.get("year") or not metadata.get("journal_name")
-            needs_fig_refresh = bool(csv_out and not figure_legends)
-            if needs_meta_refresh or needs_fig_refresh:
-                cached_figures = figure_legends
-                pdf_text, meta_extractor = extract_text(pdf_path)
-                if needs_meta_refresh:
-                    metadata = extract_metadata(pdf_text)
-                    if cached_figures:
-                        metadata["figure_legends"] = cached_figures
-                if needs_fig_refresh:
-                    figure_legends = extract_figure_legends(pdf_text)
-                    if figure_legends:
-                        metadata["figure_legends"] = figure_legends
-                if needs_meta_refresh and needs_fig_refresh:
-                    extractor = f"txt-cache+{meta_extractor}-meta+fig"
-                elif needs_meta_refresh:
-                    extractor = f"txt-cache+{meta_extractor}-meta"
-                else:
-                    extractor = f"txt-cache+{meta_extractor}-fig"
-                try:
-                    meta_path.write_text(
-                        json.dumps(metadata, ensure_ascii=False, indent=2) + "\n",
-                        encoding="utf-8",
-                        newline="\n",
-                    )
-                except OSError:
-                    pass
-
-        sections = extract_structured_sections(cleaned_text)
-
-        first_author = _extract_first_author(metadata.get("authors", ""))
-        aff_map = _parse_affiliations_map(metadata.get("affiliations", ""))
-        first_aff_nums = _extract_first_author_aff_nums(cleaned_text, metadata.get("paper_title", ""), first_author)
-        if not first_aff_nums and aff_map:
-            first_aff_nums = [sorted(aff_map.keys())[0]]
-        first_affs = " | ".join(aff_map.get(n, "").strip() for n in first_aff_nums if aff_map.get(n, "").strip())
-        first_specs = _infer_specialties_from_affiliations(first_affs)
-        diagnoses = extract_diagnoses(sections)
-
-        rows.append(
-            {
-                "pdf_path": str(pdf_path),
-                "txt_path": str(out_path),
-                "extracted_at": extracted_at,
-                "extractor": extractor,
-                "full_text": cleaned_text,
-                **metadata,
-                "first_author": first_author,
-                "first_author_affiliations": first_affs,
-                "first_author_specialties": first_specs,
-                **diagnoses,
-                **sections,
-            }
-        )
-        if wrote_txt:
-            print(out_path)
+            for _ in iter_rows():
+                pass
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        # The per-document caches only pay off within one PDF; in --watch
+        # mode with a single job they would otherwise pin the last few full
+        # texts in memory until the next change. The line-classifier caches
+        # are bounded and stay warm across runs.
+        _normalize_text.cache_clear()
+        _prepare_lines.cache_clear()
+        # Directories may be removed between --watch runs.
+        _created_dirs.clear()
+
+    if row_cache is not None and csv_out:
+        # Drop entries for PDFs that were removed or changed since the last run.
+        row_cache.clear()
+        row_cache.update(refreshed_cache)
 
     if csv_out:
-        write_csv(rows, csv_out)
         print(csv_out)
     if sync_output:
         _sync_txt_outputs(txt_out, expected_outputs)
@@ -2050,10 +2227,31 @@ def main(argv: list[str] | None = None) -> int:
         "--interval",
         type=float,
         default=10.0,
-        help="Polling interval seconds for --watch (default: 10)",
+        help="Polling interval seconds for --watch when watchdog is not installed (default: 10)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "--workers",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of PDFs to process in parallel; 0 uses all CPU cores (default: 1)",
+    )
+    parser.add_argument(
+        "--metadata-only",
+        action="store_true",
+        help=f"Only read the first {_FRONT_MATTER_PAGES} pages of each PDF and write metadata columns to --csv-out "
+        "(no .txt/.meta.json output)",
     )
     args = parser.parse_args(argv)
 
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    if args.metadata_only and not args.csv_out:
+        parser.error("--metadata-only requires --csv-out")
+
     if args.watch and args.input.is_file():
         raise SystemExit("--watch requires --input to be a directory")
 
@@ -2066,7 +2264,7 @@ def main(argv: list[str] | None = None) -> int:
         pdfs = iter_pdfs(args.input)
         if not pdfs:
             if args.sync_output:
-                process_pdfs([], input_root, args.txt_out, args.csv_out, args.force, True)
+                process_pdfs([], input_root, args.txt_out, args.csv_out, args.force, True, args.jobs)
                 print(f"No PDFs found under --input: {args.input} (synced outputs)")
                 return 0
             raise SystemExit(
@@ -2077,11 +2275,26 @@ def main(argv: list[str] | None = None) -> int:
                 "  ./run.sh /path/to/file.pdf\n"
                 "Tip: add --sync to also remove stale outputs."
             )
-        process_pdfs(pdfs, input_root, args.txt_out, args.csv_out, args.force, args.sync_output)
+        process_pdfs(
+            pdfs,
+            input_root,
+            args.txt_out,
+            args.csv_out,
+            args.force,
+            args.sync_output,
+            args.jobs,
+            metadata_only=args.metadata_only,
+        )
         return 0
 
-    print(f"Watching: {args.input} (interval={args.interval}s)")
-    last_states: list[tuple[str, int, int]] | None = None
+    changed = threading.Event()
+    observer = _start_pdf_observer(args.input, changed)
+    if observer is not None:
+        print(f"Watching: {args.input} (filesystem events)")
+    else:
+        print(f"Watching: {args.input} (interval={args.interval}s)")
+    last_states: dict[str, tuple[int, int]] | None = None
+    row_cache: dict[tuple[str, int, int], dict[str, str]] = {}
     try:
         while True:
             pdfs = iter_pdfs(args.input)
@@ -2089,13 +2302,42 @@ def main(argv: list[str] | None = None) -> int:
             if last_states is None:
                 last_states = states
                 if pdfs or args.sync_output:
-                    process_pdfs(pdfs, input_root, args.txt_out, args.csv_out, args.force, args.sync_output)
+                    process_pdfs(
+                        pdfs,
+                        input_root,
+                        args.txt_out,
+                        args.csv_out,
+                        args.force,
+                        args.sync_output,
+                        args.jobs,
+                        row_cache,
+                        metadata_only=args.metadata_only,
+                        pdf_states=states,
+                    )
             elif states != last_states:
                 last_states = states
-                process_pdfs(pdfs, input_root, args.txt_out, args.csv_out, args.force, args.sync_output)
-            time.sleep(args.interval)
+                process_pdfs(
+                    pdfs,
+                    input_root,
+                    args.txt_out,
+                    args.csv_out,
+                    args.force,
+                    args.sync_output,
+                    args.jobs,
+                    row_cache,
+                    metadata_only=args.metadata_only,
+                    pdf_states=states,
+                )
+            if observer is None:
+                time.sleep(args.interval)
+            else:
+                _wait_for_pdf_events(changed)
     except KeyboardInterrupt:
         return 0
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
 
     return 0
 
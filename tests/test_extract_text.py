@@ -6,7 +6,7 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from case_report_pipeline import extract_text  # noqa: E402
+from case_report_pipeline import extract_front_matter_text, extract_text  # noqa: E402
 
 
 class TestExtractText(unittest.TestCase):
@@ -27,6 +27,25 @@ class TestExtractText(unittest.TestCase):
             self.assertIn("Hello Case Report", text)
             self.assertIn(extractor, {"pdftotext", "pymupdf"})
 
+    def test_extract_front_matter_text_stops_after_max_pages(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf_path = Path(tmp) / "sample.pdf"
+
+            warnings.filterwarnings("ignore", category=DeprecationWarning)
+            import fitz  # type: ignore
+
+            doc = fitz.open()
+            for n in range(1, 4):
+                page = doc.new_page()
+                page.insert_text((72, 72), f"Page marker {n}")
+            doc.save(str(pdf_path))
+            doc.close()
+
+            text, _ = extract_front_matter_text(pdf_path, max_pages=2)
+            self.assertIn("Page marker 1", text)
+            self.assertIn("Page marker 2", text)
+            self.assertNotIn("Page marker 3", text)
+
 
 if __name__ == "__main__":
     unittest.main()
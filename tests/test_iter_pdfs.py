@@ -22,6 +22,21 @@ class TestIterPdfs(unittest.TestCase):
             names = {p.name for p in pdfs}
             self.assertEqual(names, {"a.PDF", "b.pdf", "d.PdF"})
 
+    def test_iter_pdfs_skips_directories_named_pdf_and_sorts(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "z.pdf").write_bytes(b"")
+            (root / "folder.pdf").mkdir()
+            (root / "folder.pdf" / "inner.pdf").write_bytes(b"")
+            (root / "a" / "b").mkdir(parents=True)
+            (root / "a" / "b" / "deep.pdf").write_bytes(b"")
+
+            pdfs = iter_pdfs(root)
+            self.assertEqual(
+                pdfs,
+                [root / "a" / "b" / "deep.pdf", root / "folder.pdf" / "inner.pdf", root / "z.pdf"],
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,56 @@
+import csv
+import hashlib
+import io
+import json
+import os
 import tempfile
+import time
 import unittest
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from case_report_pipeline import _output_paths_for_pdf, _sync_txt_outputs, process_pdfs  # noqa: E402
+from case_report_pipeline import (  # noqa: E402
+    _output_paths_for_pdf,
+    _pdf_states,
+    _sync_txt_outputs,
+    process_pdfs,
+    write_csv,
+)
+
+
+def _make_cached_corpus(root: Path, count: int) -> tuple[Path, Path]:
+    input_root = root / "in"
+    txt_out = root / "txt"
+    for i in range(count):
+        pdf_path = input_root / f"sub{i % 2}" / f"p{i}.pdf"
+        pdf_path.parent.mkdir(parents=True, exist_ok=True)
+        pdf_path.write_bytes(b"%PDF-1.4\n")
+        os.utime(pdf_path, ns=(1_000_000_000, 1_000_000_000))
+        out_path, meta_path = _output_paths_for_pdf(pdf_path, input_root, txt_out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(
+            f"Title {i}\nAbstract\nAbstract body {i}.\nReferences\n1. Example.\n",
+            encoding="utf-8-sig",
+        )
+        meta = {
+            "paper_title": f"Title {i}",
+            "journal_name": "Journal of Tests",
+            "year": "2025",
+            "authors": f"Author {i} and Other Person",
+            "figure_legends": f"Figure 1. Legend {i}.",
+        }
+        meta_path.write_text(json.dumps(meta), encoding="utf-8")
+    return input_root, txt_out
+
+
+def _read_rows(csv_path: Path) -> list[dict[str, str]]:
+    with csv_path.open(encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.DictReader(f))
+    for row in rows:
+        row.pop("extracted_at", None)
+    return rows
 
 
 class TestOutputSync(unittest.TestCase):
@@ -60,6 +105,141 @@ class TestOutputSync(unittest.TestCase):
             self.assertFalse(stale_meta.exists())
             self.assertTrue(csv_out.exists())
 
+    def test_process_pdfs_parallel_matches_serial(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            input_root, txt_out = _make_cached_corpus(root, 6)
+            pdfs = sorted(input_root.rglob("*.pdf"))
+            serial_csv = root / "serial.csv"
+            parallel_csv = root / "parallel.csv"
+
+            process_pdfs(pdfs, input_root, txt_out, serial_csv, force=False, sync_output=False)
+            process_pdfs(pdfs, input_root, txt_out, parallel_csv, force=False, sync_output=True, jobs=3)
+
+            serial_rows = _read_rows(serial_csv)
+            self.assertEqual(len(serial_rows), 6)
+            self.assertEqual(serial_rows, _read_rows(parallel_csv))
+            self.assertEqual([r["pdf_path"] for r in serial_rows], [str(p) for p in pdfs])
+            self.assertEqual(len(list(txt_out.rglob("*.txt"))), 6)
+
+    def test_process_pdfs_row_cache_reuses_unchanged_pdfs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            input_root, txt_out = _make_cached_corpus(root, 3)
+            pdfs = sorted(input_root.rglob("*.pdf"))
+            csv_out = root / "out.csv"
+            row_cache: dict = {}
+
+            process_pdfs(pdfs, input_root, txt_out, csv_out, force=False, sync_output=False, row_cache=row_cache)
+            self.assertEqual(len(row_cache), 3)
+            first_rows = _read_rows(csv_out)
+
+            # A cached row is served without re-reading the .txt output.
+            out_path, _ = _output_paths_for_pdf(pdfs[0], input_root, txt_out)
+            out_path.write_text("changed\n", encoding="utf-8-sig")
+            process_pdfs(pdfs, input_root, txt_out, csv_out, force=False, sync_output=False, row_cache=row_cache)
+            self.assertEqual(_read_rows(csv_out), first_rows)
+
+            # Touching the PDF changes its state key, so the stale entry is evicted.
+            os.utime(pdfs[0], ns=(1_000_000_000, 500_000_000))
+            process_pdfs(pdfs, input_root, txt_out, csv_out, force=False, sync_output=False, row_cache=row_cache)
+            self.assertEqual(len(row_cache), 3)
+            self.assertEqual(_read_rows(csv_out)[0]["full_text"], "changed\n")
+
+    def test_process_pdfs_row_cache_uses_watch_states(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            input_root, txt_out = _make_cached_corpus(root, 2)
+            pdfs = sorted(input_root.rglob("*.pdf"))
+            csv_out = root / "out.csv"
+            row_cache: dict = {}
+
+            states = _pdf_states(pdfs)
+            self.assertEqual(set(states), {os.path.abspath(p) for p in pdfs})
+            process_pdfs(pdfs, input_root, txt_out, csv_out, False, False, row_cache=row_cache, pdf_states=states)
+            first_rows = _read_rows(csv_out)
+
+            out_path, _ = _output_paths_for_pdf(pdfs[0], input_root, txt_out)
+            out_path.write_text("changed\n", encoding="utf-8-sig")
+            process_pdfs(pdfs, input_root, txt_out, csv_out, False, False, row_cache=row_cache, pdf_states=states)
+            self.assertEqual(_read_rows(csv_out), first_rows)
+
+            os.utime(pdfs[0], ns=(1_000_000_000, 500_000_000))
+            new_states = _pdf_states(pdfs)
+            self.assertNotEqual(new_states, states)
+            process_pdfs(pdfs, input_root, txt_out, csv_out, False, False, row_cache=row_cache, pdf_states=new_states)
+            self.assertEqual(_read_rows(csv_out)[0]["full_text"], "changed\n")
+
+    def test_process_pdfs_touched_pdf_records_new_mtime(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            input_root, txt_out = _make_cached_corpus(root, 1)
+            pdf_path = next(input_root.rglob("*.pdf"))
+            _, meta_path = _output_paths_for_pdf(pdf_path, input_root, txt_out)
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            meta["source_pdf_size"] = str(pdf_path.stat().st_size)
+            meta["source_pdf_mtime_ns"] = "1000000000"
+            meta["source_pdf_sha256"] = hashlib.sha256(pdf_path.read_bytes()).hexdigest()
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+            # Newer than the .txt but byte-identical: verified by hash, no re-extraction.
+            touched_ns = time.time_ns() + 60_000_000_000
+            os.utime(pdf_path, ns=(touched_ns, touched_ns))
+            csv_out = root / "out.csv"
+            process_pdfs([pdf_path], input_root, txt_out, csv_out, force=False, sync_output=False)
+
+            self.assertEqual(_read_rows(csv_out)[0]["extractor"], "txt-cache")
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            self.assertEqual(meta["source_pdf_mtime_ns"], str(touched_ns))
+
+    def test_process_pdfs_trusts_complete_meta_without_legends(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            input_root, txt_out = _make_cached_corpus(root, 1)
+            pdf_path = next(input_root.rglob("*.pdf"))
+            _, meta_path = _output_paths_for_pdf(pdf_path, input_root, txt_out)
+            # Written by a full extraction of a PDF with no year and no legends.
+            meta = {"paper_title": "Title 0", "figure_legends": "", "source_pdf_mtime_ns": "1000000000"}
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+            csv_out = root / "out.csv"
+            process_pdfs([pdf_path], input_root, txt_out, csv_out, force=False, sync_output=False)
+
+            self.assertEqual(_read_rows(csv_out)[0]["extractor"], "txt-cache")
+
+    def test_write_csv_keeps_previous_file_when_rows_fail(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_out = Path(tmp) / "out.csv"
+            write_csv([{"pdf_path": "a.pdf"}], csv_out)
+            before = csv_out.read_bytes()
+
+            def rows():
+                yield {"pdf_path": "b.pdf"}
+                raise RuntimeError("extraction failed")
+
+            with self.assertRaises(RuntimeError):
+                write_csv(rows(), csv_out)
+            self.assertEqual(csv_out.read_bytes(), before)
+            self.assertEqual(list(Path(tmp).iterdir()), [csv_out])
+
+    def test_write_csv_matches_dictwriter_quote_all(self) -> None:
+        rows = [
+            {"pdf_path": 'a "quoted" name.pdf', "full_text": "line1\nline2\r\nline3", "doi": ""},
+            {"paper_title": "comma, semicolon; tab\t", "authors": "田中 太郎", "extra": "ignored"},
+            {},
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_out = Path(tmp) / "out.csv"
+            write_csv(rows, csv_out)
+            with csv_out.open(encoding="utf-8-sig", newline="") as f:
+                fieldnames = next(csv.reader(f))
+            expected = io.StringIO(newline="")
+            writer = csv.DictWriter(
+                expected, fieldnames=fieldnames, extrasaction="ignore", quoting=csv.QUOTE_ALL, lineterminator="\r\n"
+            )
+            writer.writeheader()
+            writer.writerows(rows)
+            self.assertEqual(csv_out.read_bytes(), b"\xef\xbb\xbf" + expected.getvalue().encode("utf-8"))
+
 
 if __name__ == "__main__":
     unittest.main()